@@ -58,6 +58,20 @@ INDICATOR_ENDPOINTS: Dict[str, Tuple[str, str, str]] = {
 # -------------------------------------------------------------------
 
 
+def _parse_record(record: Any, value_field: str) -> tuple[str, float] | None:
+    """Return ``(date, value)`` for one record, or None if unusable."""
+    if not isinstance(record, dict):
+        return None
+    date_str = record.get("d")
+    raw_value = record.get(value_field)
+    if date_str is None or raw_value is None:
+        return None
+    try:
+        return date_str, float(str(raw_value).replace(",", "."))
+    except (ValueError, TypeError):
+        return None
+
+
 def parse_json_timeseries(
     data: Any,
     value_field: str,
@@ -75,20 +89,31 @@ def parse_json_timeseries(
 
     rows: List[Tuple[str, float]] = []
     for record in data:
-        if not isinstance(record, dict):
-            continue
-        date_str = record.get("d")
-        raw_value = record.get(value_field)
-        if date_str is None or raw_value is None:
-            continue
-        try:
-            value = float(str(raw_value).replace(",", "."))
-        except (ValueError, TypeError):
-            continue
-        rows.append((date_str, value))
+        row = _parse_record(record, value_field)
+        if row is not None:
+            rows.append(row)
     return rows
 
 
+def parse_json_latest(
+    data: Any,
+    value_field: str,
+) -> tuple[str, float] | None:
+    """Return the last valid (date, value) pair of a BGeometrics JSON array.
+
+    Equivalent to ``parse_json_timeseries(data, value_field)[-1]`` but
+    scans from the end, so only the trailing records of a multi-year
+    series are converted.
+    """
+    if not isinstance(data, list):
+        return None
+    for record in reversed(data):
+        row = _parse_record(record, value_field)
+        if row is not None:
+            return row
+    return None
+
+
 # -------------------------------------------------------------------
 # Client
 # -------------------------------------------------------------------
@@ -183,11 +208,11 @@ class BGeometricsClient:
             r = self._session.get(url, timeout=self.cfg.timeout_sec)
             r.raise_for_status()
             data = r.json()
-            rows = parse_json_timeseries(data, value_field)
-            if not rows:
+            latest = parse_json_latest(data, value_field)
+            if latest is None:
                 log.warning("BGeometrics %s: empty response", label)
                 return None
-            date_str, value = rows[-1]
+            date_str, value = latest
             log.debug("BGeometrics %s: %s = %s", label, date_str, value)
             return round(value, 6)
         except requests.RequestException as exc:
@@ -14,6 +14,8 @@ one background Worker without race conditions.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Protocol, Tuple
@@ -64,6 +66,11 @@ def _extract_close(df: pd.DataFrame, symbol: str) -> pd.Series:
         elif ("Adj Close", symbol) in df.columns:
             s = df[("Adj Close", symbol)]
         else:
+            # Only a single-ticker frame may fall back to whatever Close
+            # column it has; a batch frame must never yield another
+            # symbol's prices.
+            if df.columns.get_level_values(-1).nunique() != 1:
+                return pd.Series(dtype=float)
             close_cols = [c for c in df.columns if "Close" in c]
             if not close_cols:
                 return pd.Series(dtype=float)
@@ -396,6 +403,47 @@ class MarketProvider:
         self._cache.set(cache_key, s, timedelta(minutes=10))
         return s
 
+    def get_daily_closes(
+        self,
+        symbols: Sequence[str],
+        lookback_days: int,
+    ) -> dict[str, pd.Series]:
+        """Daily closes for several symbols with one ``yf.download`` call.
+
+        Shares cache entries with :meth:`get_daily_close`; only symbols
+        missing from the cache are downloaded.  A symbol absent from the
+        batch result gets an empty Series.
+        """
+        out: dict[str, pd.Series] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            cached = self._cache.get(f"daily_close:{symbol}:{lookback_days}")
+            if cached is not None:
+                out[symbol] = cached
+            else:
+                missing.append(symbol)
+        if not missing:
+            return out
+
+        period_days = max(lookback_days + 10, 30)
+        df = yf.download(
+            missing,
+            period=f"{period_days}d",
+            interval="1d",
+            auto_adjust=False,
+            progress=False,
+        )
+        for symbol in missing:
+            if df is None or df.empty:
+                s = pd.Series(dtype=float)
+            else:
+                s = _extract_close(df, symbol).tail(lookback_days)
+            self._cache.set(
+                f"daily_close:{symbol}:{lookback_days}", s, timedelta(minutes=10)
+            )
+            out[symbol] = s
+        return out
+
     def get_vix_daily(self, lookback_days: int = 45) -> pd.Series:
         cache_key = f"vix:{lookback_days}"
         cached = self._cache.get(cache_key)
@@ -423,7 +471,7 @@ class MarketProvider:
         """Fetch BTC-USD daily close for indicator calculations."""
         return self.get_daily_close("BTC-USD", lookback_days)
 
-    # -- Non-yfinance fetches (thread-safe, but sequential is fine) ---
+    # -- Non-yfinance fetches (thread-safe) ---------------------------
 
     def get_fear_greed(self) -> Dict[str, Optional[Tuple[int, str]]]:
         return {
@@ -438,75 +486,98 @@ class MarketProvider:
         Returns a dict mapping indicator key → numeric value.
         Values that cannot be computed are omitted (not set to None).
         """
-        values: Dict[str, float] = {}
+        values = self._rsi_indicator()
+        values.update(self._cbbi_indicator())
+        values.update(self._bgeometrics_indicators())
 
-        # RSI from BTC-USD price data (pure calculation)
+        # Merge any externally-set values (VDD, LTH RP, etc.)
+        values.update(self.latest_indicator_values)
+
+        return values
+
+    def _rsi_indicator(self) -> dict[str, float]:
+        # RSI from BTC-USD price data (yfinance + pure calculation)
         try:
             btc = self.get_btc_close(120)
             rsi = calculate_rsi(btc, period=14)
             if rsi is not None:
-                values["rsi"] = rsi
+                return {"rsi": rsi}
         except Exception as exc:
             log.warning("RSI calculation failed: %s", exc)
+        return {}
 
+    def _cbbi_indicator(self) -> dict[str, float]:
         # CBBI from colintalkscrypto.com
         try:
             cbbi = self._cbbi.get_latest()
             if cbbi is not None:
-                values["cbbi"] = cbbi
+                return {"cbbi": cbbi}
         except Exception as exc:
             log.warning("CBBI fetch failed: %s", exc)
+        return {}
 
+    def _bgeometrics_indicators(self) -> dict[str, float]:
         # MVRV Z-Score + NUPL from BGeometrics (free on-chain API)
         try:
-            bg_values = self._bgeometrics.get_all_latest()
-            values.update(bg_values)
+            return dict(self._bgeometrics.get_all_latest())
         except Exception as exc:
             log.warning("BGeometrics indicators failed: %s", exc)
-
-        # Merge any externally-set values (VDD, LTH RP, etc.)
-        values.update(self.latest_indicator_values)
-
-        return values
+        return {}
 
     # -- Consolidated fetch (run this in ONE background thread) -------
 
     def fetch_all(self) -> DashboardSnapshot:
-        """Fetch ALL dashboard data in a single sequential pass.
+        """Fetch ALL dashboard data for one refresh.
 
         This is the method the GUI should call from its background
-        Worker.  All yfinance calls run on the same thread,
-        eliminating race conditions.
+        Worker.  All yfinance calls run sequentially on the calling
+        thread, eliminating race conditions.  The plain-HTTP sources
+        (Fear & Greed, CBBI, BGeometrics) never touch yfinance and are
+        fetched concurrently on a small thread pool meanwhile.
         """
-        # 1) Prices (sequential yfinance calls)
-        prices: Dict[str, pd.Series] = {}
-        for symbol in PRICE_SYMBOLS:
+        with ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="dashboard-http"
+        ) as pool:
+            fg_future = pool.submit(self.get_fear_greed)
+            cbbi_future = pool.submit(self._cbbi_indicator)
+            bg_future = pool.submit(self._bgeometrics_indicators)
+
+            # 1) Prices (one batched yfinance call for all symbols).  If the
+            #    batch fails, download per symbol so one bad symbol only
+            #    blanks its own card.
+            try:
+                prices = self.get_daily_closes(PRICE_SYMBOLS, 10)
+            except Exception as exc:
+                log.warning("Batch price fetch failed: %s", exc)
+                prices = {}
+                for symbol in PRICE_SYMBOLS:
+                    try:
+                        prices[symbol] = self.get_daily_close(symbol, 10)
+                    except Exception as exc:
+                        log.warning("Price fetch failed for %s: %s", symbol, exc)
+                        prices[symbol] = pd.Series(dtype=float)
+
+            # 2) VIX (also yfinance — must be sequential)
             try:
-                prices[symbol] = self.get_daily_close(symbol, 10)
+                vix = self.get_vix_daily(45)
             except Exception as exc:
-                log.warning("Price fetch failed for %s: %s", symbol, exc)
-                prices[symbol] = pd.Series(dtype=float)
+                log.warning("VIX fetch failed: %s", exc)
+                vix = pd.Series(dtype=float)
 
-        # 2) VIX (also yfinance — must be sequential)
-        try:
-            vix = self.get_vix_daily(45)
-        except Exception as exc:
-            log.warning("VIX fetch failed: %s", exc)
-            vix = pd.Series(dtype=float)
+            # 3) RSI (BTC price is yfinance)
+            indicators = self._rsi_indicator()
 
-        # 3) Fear & Greed (HTTP, not yfinance — safe either way)
-        try:
-            fg = self.get_fear_greed()
-        except Exception as exc:
-            log.warning("F&G fetch failed: %s", exc)
-            fg = {}
+            # 4) Collect the HTTP results
+            try:
+                fg = fg_future.result()
+            except Exception as exc:
+                log.warning("F&G fetch failed: %s", exc)
+                fg = {}
+            indicators.update(cbbi_future.result())
+            indicators.update(bg_future.result())
 
-        # 4) Indicators (BTC price is yfinance, then CBBI is HTTP)
-        try:
-            indicators = self.get_indicators()
-        except Exception as exc:
-            log.warning("Indicator fetch failed: %s", exc)
-            indicators = {}
+        # Merge any externally-set values (VDD, LTH RP, etc.)
+        indicators.update(self.latest_indicator_values)
 
         return DashboardSnapshot(
             prices=prices,
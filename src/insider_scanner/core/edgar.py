@@ -7,6 +7,7 @@ as required by https://www.sec.gov/os/accessing-edgar-data.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 
 from insider_scanner.core.models import InsiderTrade
 from insider_scanner.utils.config import EDGAR_CACHE_DIR
@@ -182,10 +183,18 @@ def fetch_company_info(cik: str, use_cache: bool = True) -> dict:
         return {}
 
 
+@lru_cache(maxsize=50_000)
+def _edgar_search_url(name_plus: str, ticker: str, start: str, end: str) -> str:
+    """Format an EDGAR full-text search URL (memoized per name/ticker/range)."""
+    return (
+        f"https://efts.sec.gov/LATEST/search-index?"
+        f"q=%22{name_plus}%22+%22{ticker}%22&forms=4"
+        f"&dateRange=custom&startdt={start}&enddt={end}"
+    )
+
+
 def build_edgar_url_for_trade(trade: InsiderTrade) -> str:
     """Generate an EDGAR search URL for a given trade (for verification)."""
-    name = trade.insider_name.replace(" ", "+")
-    ticker = trade.ticker
     d = trade.filing_date or trade.trade_date
     if d:
         start = d.replace(day=1).isoformat()
@@ -194,8 +203,6 @@ def build_edgar_url_for_trade(trade: InsiderTrade) -> str:
         start = "2020-01-01"
         end = "2030-12-31"
 
-    return (
-        f"https://efts.sec.gov/LATEST/search-index?"
-        f"q=%22{name}%22+%22{ticker}%22&forms=4"
-        f"&dateRange=custom&startdt={start}&enddt={end}"
+    return _edgar_search_url(
+        trade.insider_name.replace(" ", "+"), trade.ticker, start, end
     )
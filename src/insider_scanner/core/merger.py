@@ -9,7 +9,9 @@ data fields populated wins, with EDGAR URL preserved if available.
 from __future__ import annotations
 
 import json
+from dataclasses import fields
 from datetime import date
+from operator import attrgetter
 from pathlib import Path
 
 import pandas as pd
@@ -20,6 +22,10 @@ from insider_scanner.utils.logging import get_logger
 
 log = get_logger("merger")
 
+# DataFrame columns, in InsiderTrade.to_dict() order
+_DF_COLUMNS = tuple(f.name for f in fields(InsiderTrade))
+_DATE_COLUMNS = ("trade_date", "filing_date")
+
 
 def _dedup_key(trade: InsiderTrade) -> tuple:
     """Generate a deduplication key for a trade."""
@@ -75,25 +81,26 @@ def merge_trades(
     for trades in trade_lists:
         for trade in trades:
             key = _dedup_key(trade)
-            existing = seen.get(key)
-
-            if existing is None:
+            # Single probe on the common (unique trade) path: setdefault
+            # inserts and returns the trade itself when the key is new.
+            existing = seen.setdefault(key, trade)
+            if existing is trade:
+                continue
+
+            # Keep the richer record, but merge edgar_url if available
+            if _richness_score(trade) > _richness_score(existing):
+                if existing.edgar_url and not trade.edgar_url:
+                    trade.edgar_url = existing.edgar_url
+                if existing.is_congress:
+                    trade.is_congress = True
+                    trade.congress_member = existing.congress_member
                 seen[key] = trade
             else:
-                # Keep the richer record, but merge edgar_url if available
-                if _richness_score(trade) > _richness_score(existing):
-                    if existing.edgar_url and not trade.edgar_url:
-                        trade.edgar_url = existing.edgar_url
-                    if existing.is_congress:
-                        trade.is_congress = True
-                        trade.congress_member = existing.congress_member
-                    seen[key] = trade
-                else:
-                    if trade.edgar_url and not existing.edgar_url:
-                        existing.edgar_url = trade.edgar_url
-                    if trade.is_congress:
-                        existing.is_congress = True
-                        existing.congress_member = trade.congress_member
+                if trade.edgar_url and not existing.edgar_url:
+                    existing.edgar_url = trade.edgar_url
+                if trade.is_congress:
+                    existing.is_congress = True
+                    existing.congress_member = trade.congress_member
 
     merged = list(seen.values())
 
@@ -163,19 +170,33 @@ def filter_trades(
 
 
 def trades_to_dataframe(trades: list[InsiderTrade]) -> pd.DataFrame:
-    """Convert a list of InsiderTrade to a pandas DataFrame."""
+    """Convert a list of InsiderTrade to a pandas DataFrame.
+
+    Columns and values match :meth:`InsiderTrade.to_dict`, but the frame is
+    built column by column instead of from one dict per trade.
+    """
     if not trades:
         return pd.DataFrame()
-    return pd.DataFrame([t.to_dict() for t in trades])
+    rows = map(attrgetter(*_DF_COLUMNS), trades)
+    columns = dict(zip(_DF_COLUMNS, map(list, zip(*rows))))
+    for name in _DATE_COLUMNS:
+        columns[name] = [str(d) if d else "" for d in columns[name]]
+    return pd.DataFrame(columns)
 
 
 def save_scan_results(
     trades: list[InsiderTrade],
     label: str = "scan",
     output_dir: Path | None = None,
+    *,
+    df: pd.DataFrame | None = None,
 ) -> Path:
     """Save scan results as CSV and JSON.
 
+    *df*, when given, must be ``trades_to_dataframe(trades)`` (e.g. a frame
+    the caller already holds); it is written as the CSV instead of being
+    rebuilt.
+
     Returns the output directory.
     """
     ensure_dirs()
@@ -183,7 +204,8 @@ def save_scan_results(
     out.mkdir(parents=True, exist_ok=True)
 
     # CSV
-    df = trades_to_dataframe(trades)
+    if df is None:
+        df = trades_to_dataframe(trades)
     csv_path = out / f"{label}.csv"
     df.to_csv(csv_path, index=False)
 
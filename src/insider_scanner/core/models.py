@@ -7,6 +7,20 @@ from datetime import date
 from typing import Literal
 
 
+def _iso_date(value) -> date | None:
+    """Parse an ISO date string, returning None for empty or invalid input.
+
+    ``date`` objects (e.g. from a deserializer that already decoded them)
+    are passed through unchanged.
+    """
+    try:
+        return date.fromisoformat(value)
+    except TypeError:
+        return value if isinstance(value, date) else None
+    except ValueError:
+        return None
+
+
 @dataclass
 class InsiderTrade:
     """Unified insider trade record from any source."""
@@ -55,16 +69,14 @@ class InsiderTrade:
 
     @classmethod
     def from_dict(cls, d: dict) -> "InsiderTrade":
-        td = d.get("trade_date", "")
-        fd = d.get("filing_date", "")
         return cls(
             ticker=d.get("ticker", ""),
             company=d.get("company", ""),
             insider_name=d.get("insider_name", ""),
             insider_title=d.get("insider_title", ""),
             trade_type=d.get("trade_type", "Other"),
-            trade_date=date.fromisoformat(td) if td else None,
-            filing_date=date.fromisoformat(fd) if fd else None,
+            trade_date=_iso_date(d.get("trade_date")),
+            filing_date=_iso_date(d.get("filing_date")),
             shares=float(d.get("shares", 0)),
             price=float(d.get("price", 0)),
             value=float(d.get("value", 0)),
@@ -132,16 +144,14 @@ class CongressTrade:
 
     @classmethod
     def from_dict(cls, d: dict) -> "CongressTrade":
-        td = d.get("trade_date", "")
-        fd = d.get("filing_date", "")
         return cls(
             official_name=d.get("official_name", ""),
             chamber=d.get("chamber", ""),
             party=d.get("party", ""),
-            filing_date=date.fromisoformat(fd) if fd else None,
+            filing_date=_iso_date(d.get("filing_date")),
             doc_id=d.get("doc_id", ""),
             source_url=d.get("source_url", ""),
-            trade_date=date.fromisoformat(td) if td else None,
+            trade_date=_iso_date(d.get("trade_date")),
             asset_description=d.get("asset_description", ""),
             ticker=d.get("ticker", ""),
             trade_type=d.get("trade_type", "Other"),
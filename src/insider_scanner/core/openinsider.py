@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import re
+from copy import copy
 from datetime import date
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+import lxml.html  # type: ignore[import-untyped]
+from lxml import etree  # type: ignore[import-untyped]
 
 from insider_scanner.core.models import InsiderTrade
 from insider_scanner.utils.config import SCRAPER_CACHE_DIR
@@ -15,27 +19,120 @@ log = get_logger("openinsider")
 
 BASE_URL = "http://openinsider.com"
 
+# Header text → column key.  Branches are zero-width lookaheads anchored at
+# the start, so the first matching branch wins (same priority as an
+# if/elif chain) and each header is classified in one C-level scan.
+_HEADER_RE = re.compile(
+    r"(?=.*filing)(?=.*date)(?P<filing_date>)"
+    r"|(?=.*trade)(?=.*date)(?P<trade_date>)"
+    r"|(?=.*ticker)(?P<ticker>)"
+    r"|(?=.*company)(?P<company>)"
+    r"|(?=.*insider)(?=.*name)(?P<name>)"
+    r"|(?=.*title)(?P<title>)"
+    r"|(?=.*type)(?P<type>)"
+    r"|(?=.*qty|(?!.*owned).*shares)(?P<shares>)"
+    r"|(?=.*price)(?P<price>)"
+    r"|(?=.*value)(?P<value>)"
+    r"|(?=.*owned)(?P<owned_after>)",
+    re.DOTALL,
+)
+
+# Columns read from every data row, in unpacking order
+_COLUMN_KEYS = (
+    "ticker",
+    "company",
+    "name",
+    "title",
+    "type",
+    "trade_date",
+    "filing_date",
+    "shares",
+    "price",
+    "value",
+    "owned_after",
+)
+
+
+@lru_cache(maxsize=16)
+def _column_indices(headers: tuple[str, ...]) -> tuple[int, ...]:
+    """Position of each ``_COLUMN_KEYS`` column in *headers* (-1 if absent).
+
+    Memoized: every page from the site shares the same header row, so the
+    header regex runs once per distinct header row, not once per page.
+    """
+    col_map: dict[str, int] = {}
+    for i, h in enumerate(headers):
+        m = _HEADER_RE.match(h)
+        if m and (name := m.lastgroup):
+            col_map.setdefault(name, i)
+    return tuple(col_map.get(key, -1) for key in _COLUMN_KEYS)
+
+
+def _html_root(html: str):
+    """Parse *html* with lxml, returning the root element or None if empty."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # str input carrying an XML encoding declaration must go in as bytes
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _text(el, sep: str = "") -> str:
+    """Stripped text of *el* and its descendants (like bs4 ``get_text(strip=True)``)."""
+    if not len(el):  # leaf cell: skip the itertext walk
+        return (el.text or "").strip()
+    return sep.join([s for t in el.itertext() if (s := t.strip())])
+
+
+_fromisoformat = date.fromisoformat
+
 
 def _parse_date(text: str) -> date | None:
     text = text.strip()
     if not text or text == "-":
         return None
     try:
-        return date.fromisoformat(text)
+        return _fromisoformat(text)
     except ValueError:
         pass
-    # Try MM/DD/YYYY
+    # YYYY-MM-DD followed by a time, or MM/DD/YYYY (MM-DD-YYYY)
+    sep = "/" if "/" in text else "-"
+    first, _, rest = text.partition(sep)
+    second, _, third = rest.partition(sep)
     try:
-        parts = text.split("/")
-        if len(parts) == 3:
-            return date(int(parts[2]), int(parts[0]), int(parts[1]))
-    except (ValueError, IndexError):
-        pass
-    return None
+        if len(first) == 4:
+            return date(int(first), int(second), int(third[:2]))
+        return date(int(third), int(first), int(second))
+    except ValueError:
+        return None
 
 
 def _parse_number(text: str) -> float:
-    text = text.strip().replace(",", "").replace("$", "").replace("+", "")
+    return _to_float(text.strip().replace(",", "").replace("$", "").replace("+", ""))
+
+
+# Characters dropped from numeric cells.  translate() beats chained
+# replace() on a whole joined column, but not on a single short cell.
+_NUM_JUNK = str.maketrans("", "", ",$+")
+
+
+def _parse_numbers(texts: list[str]) -> list[float]:
+    """Parse a whole column of numeric cells at once.
+
+    Equivalent to ``[_parse_number(t) for t in texts]``, but the
+    ``,``/``$``/``+`` cleanup runs once over the joined column rather
+    than three ``str.replace`` calls per cell.
+    """
+    if not texts:
+        return []
+    cleaned = "\0".join([t.strip() for t in texts]).translate(_NUM_JUNK)
+    return [_to_float(t) for t in cleaned.split("\0")]
+
+
+def _to_float(text: str) -> float:
+    """Convert cleaned numeric text; ``(x)`` is negative, junk is 0.0."""
     if not text or text == "-":
         return 0.0
     negative = False
@@ -49,6 +146,7 @@ def _parse_number(text: str) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=256)
 def _classify_trade(text: str) -> str:
     t = text.strip().lower()
     if "purchase" in t or "buy" in t or t == "p":
@@ -169,85 +267,104 @@ def parse_openinsider_html(html: str, ticker: str = "") -> list[InsiderTrade]:
     -------
     list of InsiderTrade
     """
-    soup = BeautifulSoup(html, "lxml")
+    # Identical pages (e.g. served from the HTTP cache on a repeat scan) are
+    # parsed once; callers get fresh copies since trades are mutated downstream.
+    return [copy(t) for t in _parse_openinsider_page(html, ticker)]
+
+
+@lru_cache(maxsize=32)
+def _parse_openinsider_page(html: str, ticker: str) -> tuple[InsiderTrade, ...]:
+    """Parse one openinsider page (memoized on the raw HTML and ticker)."""
+    root = _html_root(html)
     trades: list[InsiderTrade] = []
+    if root is None:
+        return ()
 
     # openinsider uses a table with class "tinytable"
-    table = soup.find("table", class_="tinytable")
-    if table is None:
+    tables = root.xpath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '), ' tinytable ')]"
+    )
+    if tables:
+        table = tables[0]
+    else:
         # Fallback: largest table
-        tables = soup.find_all("table")
+        tables = root.xpath("//table")
         if not tables:
             log.debug("No tables found")
-            return trades
-        table = max(tables, key=lambda t: len(t.find_all("tr")))
+            return ()
+        table = max(tables, key=lambda t: t.xpath("count(.//tr)"))
 
-    rows = table.find_all("tr")
+    rows = table.xpath(".//tr")
     if len(rows) < 2:
-        return trades
+        return ()
 
     # Parse header
-    header_cells = rows[0].find_all(["th", "td"])
-    headers = [c.get_text(strip=True).lower() for c in header_cells]
-
-    col_map = {}
-    for i, h in enumerate(headers):
-        if h in ("x",):
-            continue
-        if "filing" in h and "date" in h:
-            col_map.setdefault("filing_date", i)
-        elif "trade" in h and "date" in h:
-            col_map.setdefault("trade_date", i)
-        elif "ticker" in h:
-            col_map.setdefault("ticker", i)
-        elif "company" in h:
-            col_map.setdefault("company", i)
-        elif "insider" in h and "name" in h:
-            col_map.setdefault("name", i)
-        elif "title" in h:
-            col_map.setdefault("title", i)
-        elif "trade type" in h or "type" in h:
-            col_map.setdefault("type", i)
-        elif "qty" in h or "shares" in h and "owned" not in h:
-            col_map.setdefault("shares", i)
-        elif "price" in h:
-            col_map.setdefault("price", i)
-        elif "value" in h:
-            col_map.setdefault("value", i)
-        elif "owned" in h:
-            col_map.setdefault("owned_after", i)
-
-    # Parse data rows
+    header_cells = rows[0].xpath(".//th | .//td")
+    headers = tuple(_text(c).lower() for c in header_cells)
+
+    # Parse data rows.  Row fields are collected first; the numeric columns
+    # are then parsed in one batch each (see _parse_numbers).
+    pending: list[dict] = []
+    raw_shares: list[str] = []
+    raw_price: list[str] = []
+    raw_value: list[str] = []
+    raw_owned: list[str] = []
+    # Column positions are fixed once the header is known (-1 = missing)
+    indices = _column_indices(headers)
     for row in rows[1:]:
-        cells = row.find_all("td")
-        if len(cells) < 4:
+        cells = row.findall(".//td")
+        n = len(cells)
+        if n < 4:
             continue
 
-        def cell_text(key: str) -> str:
-            idx = col_map.get(key)
-            if idx is not None and idx < len(cells):
-                return cells[idx].get_text(strip=True)
-            return ""
-
-        row_ticker = cell_text("ticker") or ticker.upper()
-
-        trade = InsiderTrade(
-            ticker=row_ticker.upper(),
-            company=cell_text("company"),
-            insider_name=cell_text("name"),
-            insider_title=cell_text("title"),
-            trade_type=_classify_trade(cell_text("type")),
-            trade_date=_parse_date(cell_text("trade_date")),
-            filing_date=_parse_date(cell_text("filing_date")),
-            shares=_parse_number(cell_text("shares")),
-            price=_parse_number(cell_text("price")),
-            value=_parse_number(cell_text("value")),
-            shares_owned_after=_parse_number(cell_text("owned_after")),
-            source="openinsider",
+        (
+            tk,
+            company,
+            name,
+            title,
+            trade_type,
+            trade_date,
+            filing_date,
+            shares_raw,
+            price_raw,
+            value_raw,
+            owned_raw,
+        ) = [_text(cells[i]) if 0 <= i < n else "" for i in indices]
+
+        pending.append(
+            {
+                "ticker": (tk or ticker.upper()).upper(),
+                "company": company,
+                "insider_name": name,
+                "insider_title": title,
+                "trade_type": _classify_trade(trade_type),
+                "trade_date": _parse_date(trade_date),
+                "filing_date": _parse_date(filing_date),
+            }
         )
-
-        if trade.insider_name or trade.shares != 0:
-            trades.append(trade)
+        raw_shares.append(shares_raw)
+        raw_price.append(price_raw)
+        raw_value.append(value_raw)
+        raw_owned.append(owned_raw)
+
+    for fields, shares, price, value, owned in zip(
+        pending,
+        _parse_numbers(raw_shares),
+        _parse_numbers(raw_price),
+        _parse_numbers(raw_value),
+        _parse_numbers(raw_owned),
+    ):
+        if fields["insider_name"] or shares != 0:
+            trades.append(
+                InsiderTrade(
+                    **fields,
+                    shares=shares,
+                    price=price,
+                    value=value,
+                    shares_owned_after=owned,
+                    source="openinsider",
+                )
+            )
 
     log.info("openinsider: parsed %d trades for %s", len(trades), ticker or "latest")
-    return trades
+    return tuple(trades)
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
+from copy import copy
 from datetime import date
+from functools import lru_cache
+from itertools import islice
 
-from bs4 import BeautifulSoup
+import lxml.html  # type: ignore[import-untyped]
+from lxml import etree  # type: ignore[import-untyped]
 
 from insider_scanner.core.models import InsiderTrade
 from insider_scanner.utils.config import SCRAPER_CACHE_DIR
@@ -15,33 +21,125 @@ log = get_logger("secform4")
 
 BASE_URL = "https://www.secform4.com/insider-trading"
 
+# Header text → column key.  Branches are zero-width lookaheads anchored at
+# the start, so the first matching branch wins (same priority as an
+# if/elif chain) and each header is classified in one C-level scan.
+_HEADER_RE = re.compile(
+    r"(?=.*transaction)(?P<transaction>)"
+    r"|(?=.*reported)(?P<reported>)"
+    r"|(?=.*company)(?P<company>)"
+    r"|(?=.*symbol)(?P<symbol>)"
+    r"|(?=.*insider|.*relationship)(?P<insider>)"
+    r"|(?=.*traded)(?P<shares>)"
+    r"|(?=.*price)(?P<price>)"
+    r"|(?=.*amount|.*total)(?P<value>)"
+    r"|(?=.*owned)(?P<owned>)"
+    r"|(?=.*filing)(?P<filing>)",
+    re.DOTALL,
+)
+
+# Columns read from every data row, in unpacking order
+_COLUMN_KEYS = (
+    "transaction",
+    "reported",
+    "company",
+    "symbol",
+    "insider",
+    "shares",
+    "price",
+    "value",
+    "owned",
+    "filing",
+)
+
+
+# <span class="pos"> holds the insider's title inside the insider cell
+_POS_SPAN = etree.XPath(
+    ".//span[contains(concat(' ', normalize-space(@class), ' '), ' pos ')]"
+)
+
+
+@lru_cache(maxsize=16)
+def _column_indices(headers: tuple[str, ...]) -> tuple[int, ...]:
+    """Position of each ``_COLUMN_KEYS`` column in *headers* (-1 if absent).
+
+    Memoized: every page from the site shares the same header row, so the
+    header regex runs once per distinct header row, not once per page.
+    """
+    col_map: dict[str, int] = {}
+    for i, h in enumerate(headers):
+        m = _HEADER_RE.match(h)
+        if m and (name := m.lastgroup):
+            col_map.setdefault(name, i)
+    return tuple(col_map.get(key, -1) for key in _COLUMN_KEYS)
+
+
+def _html_root(html: str):
+    """Parse *html* with lxml, returning the root element or None if empty."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # str input carrying an XML encoding declaration must go in as bytes
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _text(el, sep: str = "") -> str:
+    """Stripped text of *el* and its descendants (like bs4 ``get_text(strip=True)``)."""
+    if not len(el):  # leaf cell: skip the itertext walk
+        return (el.text or "").strip()
+    return sep.join([s for t in el.itertext() if (s := t.strip())])
+
+
+_fromisoformat = date.fromisoformat
+
 
 def _parse_date(text: str) -> date | None:
     """Parse date from various formats."""
     text = text.strip()
     if not text or text == "-":
         return None
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
-        try:
-            return date.fromisoformat(text) if fmt == "%Y-%m-%d" else None
-        except ValueError:
-            pass
-    # Fallback: try splitting common formats
     try:
-        parts = text.replace("/", "-").split("-")
-        if len(parts) == 3:
-            if len(parts[0]) == 4:
-                return date(int(parts[0]), int(parts[1]), int(parts[2]))
-            else:
-                return date(int(parts[2]), int(parts[0]), int(parts[1]))
-    except (ValueError, IndexError):
+        return _fromisoformat(text)
+    except ValueError:
         pass
-    return None
+    # YYYY-MM-DD followed by a time, or MM/DD/YYYY (MM-DD-YYYY)
+    sep = "/" if "/" in text else "-"
+    first, _, rest = text.partition(sep)
+    second, _, third = rest.partition(sep)
+    try:
+        if len(first) == 4:
+            return date(int(first), int(second), int(third[:2]))
+        return date(int(third), int(first), int(second))
+    except ValueError:
+        return None
 
 
 def _parse_number(text: str) -> float:
     """Parse a number string, stripping $, commas, parens (negative)."""
-    text = text.strip().replace(",", "").replace("$", "")
+    return _to_float(text.strip().replace(",", "").replace("$", ""))
+
+
+# Characters dropped from numeric cells.  translate() beats chained
+# replace() on a whole joined column, but not on a single short cell.
+_NUM_JUNK = str.maketrans("", "", ",$")
+
+
+def _parse_numbers(texts: list[str]) -> list[float]:
+    """Parse a whole column of numeric cells at once.
+
+    Equivalent to ``[_parse_number(t) for t in texts]``, but the ``,``/``$``
+    cleanup runs once over the joined column rather than per cell.
+    """
+    if not texts:
+        return []
+    cleaned = "\0".join([t.strip() for t in texts]).translate(_NUM_JUNK)
+    return [_to_float(t) for t in cleaned.split("\0")]
+
+
+def _to_float(text: str) -> float:
+    """Convert cleaned numeric text; ``(x)`` is negative, junk is 0.0."""
     if not text or text == "-":
         return 0.0
     negative = False
@@ -55,8 +153,9 @@ def _parse_number(text: str) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=256)
 def _classify_trade(text: str) -> str:
-    """Map raw trade type text to our enum."""
+    """Map raw trade type text to our enum (memoized: only a few distinct values)."""
     t = text.strip().lower()
     if "purchase" in t or "buy" in t:
         return "Buy"
@@ -112,11 +211,12 @@ def scrape_ticker(
 
     trades = parse_secform4_html(html, ticker)
 
-    # Post-filter by filing date (secform4 doesn't support date params in URL)
-    if start_date:
-        trades = [t for t in trades if t.filing_date and t.filing_date >= start_date]
-    if end_date:
-        trades = [t for t in trades if t.filing_date and t.filing_date <= end_date]
+    # Post-filter by filing date (secform4 doesn't support date params in URL),
+    # both bounds in a single pass
+    if start_date or end_date:
+        lo = start_date or date.min
+        hi = end_date or date.max
+        trades = [t for t in trades if t.filing_date and lo <= t.filing_date <= hi]
 
     return trades
 
@@ -127,7 +227,7 @@ def parse_secform4_html(html: str, ticker: str = "") -> list[InsiderTrade]:
     secform4.com uses compound table cells where multiple data fields are
     packed into a single ``<td>`` separated by ``<br>`` tags and nested
     elements.  This parser extracts sub-fields using the actual DOM
-    structure rather than plain ``get_text()``.
+    structure rather than the flattened cell text.
 
     Parameters
     ----------
@@ -140,86 +240,91 @@ def parse_secform4_html(html: str, ticker: str = "") -> list[InsiderTrade]:
     -------
     list of InsiderTrade
     """
-    soup = BeautifulSoup(html, "lxml")
+    # Identical pages (e.g. served from the HTTP cache on a repeat scan) are
+    # parsed once; callers get fresh copies since trades are mutated downstream.
+    return [copy(t) for t in _parse_secform4_page(html, ticker)]
+
+
+@lru_cache(maxsize=32)
+def _parse_secform4_page(html: str, ticker: str) -> tuple[InsiderTrade, ...]:
+    """Parse one secform4 page (memoized on the raw HTML and ticker)."""
+    root = _html_root(html)
     trades: list[InsiderTrade] = []
+    if root is None:
+        return ()
 
     # Prefer the known table id; fall back to header keyword search
-    data_table = soup.find("table", id="filing_table")
+    found = root.xpath("//table[@id='filing_table']")
+    data_table = found[0] if found else None
     if data_table is None:
-        for table in soup.find_all("table"):
-            header = table.find("tr")
-            if header and "transaction" in header.get_text().lower():
+        for table in root.iter("table"):
+            header = table.find(".//tr")
+            if (
+                header is not None
+                and "transaction" in "".join(header.itertext()).lower()
+            ):
                 data_table = table
                 break
     if data_table is None:
-        tables = soup.find_all("table")
+        tables = root.xpath("//table")
         if not tables:
             log.debug("No tables found for %s", ticker)
-            return trades
-        data_table = max(tables, key=lambda t: len(t.find_all("tr")))
+            return ()
+        data_table = max(tables, key=lambda t: t.xpath("count(.//tr)"))
 
     # Collect data rows (skip <thead>)
-    tbody = data_table.find("tbody")
-    rows = tbody.find_all("tr") if tbody else data_table.find_all("tr")[1:]
+    tbody = data_table.find(".//tbody")
+    rows = tbody.xpath(".//tr") if tbody is not None else data_table.xpath(".//tr")[1:]
     if not rows:
-        return trades
+        return ()
 
     # Build column index from the header row
-    header_row = data_table.find("thead")
-    if header_row:
-        header_cells = header_row.find_all(["th", "td"])
-    else:
-        first_row = data_table.find("tr")
-        header_cells = first_row.find_all(["th", "td"]) if first_row else []
-
-    headers = [c.get_text(separator=" ", strip=True).lower() for c in header_cells]
-    col = {}
-    for i, h in enumerate(headers):
-        if "transaction" in h:
-            col.setdefault("transaction", i)
-        elif "reported" in h:
-            col.setdefault("reported", i)
-        elif "company" in h:
-            col.setdefault("company", i)
-        elif "symbol" in h:
-            col.setdefault("symbol", i)
-        elif "insider" in h or "relationship" in h:
-            col.setdefault("insider", i)
-        elif "traded" in h:
-            col.setdefault("shares", i)
-        elif "price" in h:
-            col.setdefault("price", i)
-        elif "amount" in h or "total" in h:
-            col.setdefault("value", i)
-        elif "owned" in h:
-            col.setdefault("owned", i)
-        elif "filing" in h:
-            col.setdefault("filing", i)
-
+    header_row = data_table.find(".//thead")
+    if header_row is None:
+        header_row = data_table.find(".//tr")
+    header_cells = header_row.xpath(".//th | .//td") if header_row is not None else []
+
+    headers = tuple(_text(c, " ").lower() for c in header_cells)
+
+    # Row fields are collected first; the numeric columns are then parsed in
+    # one batch each (see _parse_numbers) before the trades are built.
+    pending: list[dict] = []
+    raw_shares: list[str] = []
+    raw_price: list[str] = []
+    raw_value: list[str] = []
+    raw_owned: list[str] = []
+    # Column positions are fixed once the header is known (-1 = missing)
+    indices = _column_indices(headers)
     for row in rows:
-        cells = row.find_all("td")
-        if len(cells) < 5:
+        cells = row.findall(".//td")
+        n = len(cells)
+        if n < 5:
             continue
 
-        def _cell(key: str):
-            """Return the <td> element for *key*, or None."""
-            idx = col.get(key)
-            if idx is not None and idx < len(cells):
-                return cells[idx]
-            return None
+        (
+            tx_cell,
+            rpt_cell,
+            comp_cell,
+            sym_cell,
+            ins_cell,
+            shares_cell,
+            price_cell,
+            value_cell,
+            own_cell,
+            filing_cell,
+        ) = [cells[i] if 0 <= i < n else None for i in indices]
 
         # --- Transaction cell: date + trade type split by <br> ---
         trade_date_val = None
         trade_type_val = "Other"
-        tx_cell = _cell("transaction")
-        if tx_cell:
-            parts = _br_split(tx_cell)
+        if tx_cell is not None:
+            parts = list(islice(_br_split(tx_cell), 2))
             if parts:
                 trade_date_val = _parse_date(parts[0])
             if len(parts) > 1:
                 trade_type_val = _classify_trade(parts[1])
             # CSS class hint: S=Sale, P=Purchase, M=Exercise
-            css = " ".join(tx_cell.get("class", []))
+            css = tx_cell.get("class", "").strip()
             if trade_type_val == "Other" and css:
                 if "S" in css:
                     trade_type_val = "Sell"
@@ -230,126 +335,115 @@ def parse_secform4_html(html: str, ticker: str = "") -> list[InsiderTrade]:
 
         # --- Reported cell: filing date (ignore time) ---
         filing_date_val = None
-        rpt_cell = _cell("reported")
-        if rpt_cell:
-            parts = _br_split(rpt_cell)
-            if parts:
-                filing_date_val = _parse_date(parts[0])
+        if rpt_cell is not None:
+            first = next(_br_split(rpt_cell), None)
+            if first:
+                filing_date_val = _parse_date(first)
 
         # --- Company ---
         company_val = ""
-        comp_cell = _cell("company")
-        if comp_cell:
-            company_val = comp_cell.get_text(strip=True)
+        if comp_cell is not None:
+            company_val = _text(comp_cell)
 
         # --- Symbol (may override ticker) ---
-        sym_cell = _cell("symbol")
         row_ticker = ticker.upper()
-        if sym_cell:
-            sym_text = sym_cell.get_text(strip=True)
+        if sym_cell is not None:
+            sym_text = _text(sym_cell)
             if sym_text:
                 row_ticker = sym_text.upper()
 
         # --- Insider cell: <a> = name, <span class="pos"> = title ---
         insider_name = ""
         insider_title = ""
-        ins_cell = _cell("insider")
-        if ins_cell:
-            a_tag = ins_cell.find("a")
-            insider_name = a_tag.get_text(strip=True) if a_tag else ""
-            pos_span = ins_cell.find("span", class_="pos")
-            insider_title = pos_span.get_text(strip=True) if pos_span else ""
+        if ins_cell is not None:
+            a_tag = ins_cell.find(".//a")
+            insider_name = _text(a_tag) if a_tag is not None else ""
+            pos_spans = _POS_SPAN(ins_cell)
+            insider_title = _text(pos_spans[0]) if pos_spans else ""
             # Fallback: if no <a>, use br-split
             if not insider_name:
-                parts = _br_split(ins_cell)
+                parts = list(islice(_br_split(ins_cell), 2))
                 insider_name = parts[0] if parts else ""
                 insider_title = parts[1] if len(parts) > 1 else insider_title
 
-        # --- Numeric columns ---
-        shares_val = (
-            _parse_number(_cell("shares").get_text(strip=True))
-            if _cell("shares")
-            else 0.0
-        )
-        price_val = (
-            _parse_number(_cell("price").get_text(strip=True))
-            if _cell("price")
-            else 0.0
-        )
-        value_val = (
-            _parse_number(_cell("value").get_text(strip=True))
-            if _cell("value")
-            else 0.0
-        )
+        # --- Numeric columns (parsed per column after the loop) ---
+        raw_shares.append(_text(shares_cell) if shares_cell is not None else "")
+        raw_price.append(_text(price_cell) if price_cell is not None else "")
+        raw_value.append(_text(value_cell) if value_cell is not None else "")
 
         # --- Shares owned: first text node, ignore <span class="ownership"> ---
-        owned_val = 0.0
-        own_cell = _cell("owned")
-        if own_cell:
-            parts = _br_split(own_cell)
-            if parts:
-                owned_val = _parse_number(parts[0])
+        raw_owned.append(next(_br_split(own_cell), "") if own_cell is not None else "")
 
         # --- Filing link ---
         edgar_url = ""
-        filing_cell = _cell("filing")
-        if filing_cell:
-            a_tag = filing_cell.find("a", href=True)
-            if a_tag:
-                href = a_tag["href"]
+        if filing_cell is not None:
+            a_tag = filing_cell.find(".//a[@href]")
+            if a_tag is not None:
+                href = a_tag.get("href")
                 if href.startswith("/"):
                     edgar_url = f"https://www.secform4.com{href}"
                 else:
                     edgar_url = href
 
-        trade = InsiderTrade(
-            ticker=row_ticker,
-            company=company_val,
-            insider_name=insider_name,
-            insider_title=insider_title,
-            trade_type=trade_type_val,
-            trade_date=trade_date_val,
-            filing_date=filing_date_val,
-            shares=shares_val,
-            price=price_val,
-            value=value_val,
-            shares_owned_after=owned_val,
-            source="secform4",
-            edgar_url=edgar_url,
+        pending.append(
+            {
+                "ticker": row_ticker,
+                "company": company_val,
+                "insider_name": insider_name,
+                "insider_title": insider_title,
+                "trade_type": trade_type_val,
+                "trade_date": trade_date_val,
+                "filing_date": filing_date_val,
+                "edgar_url": edgar_url,
+            }
         )
 
-        if trade.insider_name or trade.shares != 0:
-            trades.append(trade)
+    for fields, shares, price, value, owned in zip(
+        pending,
+        _parse_numbers(raw_shares),
+        _parse_numbers(raw_price),
+        _parse_numbers(raw_value),
+        _parse_numbers(raw_owned),
+    ):
+        if fields["insider_name"] or shares != 0:
+            trades.append(
+                InsiderTrade(
+                    **fields,
+                    shares=shares,
+                    price=price,
+                    value=value,
+                    shares_owned_after=owned,
+                    source="secform4",
+                )
+            )
 
     log.info("secform4: parsed %d trades for %s", len(trades), ticker)
-    return trades
+    return tuple(trades)
 
 
-def _br_split(td) -> list[str]:
-    """Split a <td> element on <br> tags and return stripped text parts.
+def _br_split(td) -> Iterator[str]:
+    """Split a <td> element on <br> tags and yield stripped text parts.
 
     Handles nested elements (spans, links) by collecting text nodes
-    between <br> separators.
+    between <br> separators.  Parts are produced lazily, so callers that
+    only need the first one or two (via ``islice``) stop walking early.
     """
-    from bs4 import NavigableString, Tag
-
-    parts: list[str] = []
     current: list[str] = []
 
-    for child in td.children:
-        if isinstance(child, Tag) and child.name == "br":
+    if td.text:
+        current.append(td.text.strip())
+    for child in td:
+        if child.tag == "br":
             text = "".join(current).strip()
             if text:
-                parts.append(text)
+                yield text
             current = []
-        elif isinstance(child, Tag):
-            current.append(child.get_text(strip=True))
-        elif isinstance(child, NavigableString):
-            current.append(str(child).strip())
+        elif isinstance(child.tag, str):
+            current.append(_text(child))
+        if child.tail:
+            current.append(child.tail.strip())
 
     # Flush remaining
     text = "".join(current).strip()
     if text:
-        parts.append(text)
-
-    return parts
+        yield text
@@ -10,6 +10,10 @@ and would require paid data services. This module documents that limitation.
 from __future__ import annotations
 
 import json
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 
 from insider_scanner.core.models import InsiderTrade
@@ -23,7 +27,9 @@ def load_congress_members(path: Path | None = None) -> list[dict]:
     """Load the Congress member list from disk.
 
     Returns a list of dicts, each with at least ``"name"`` and optional
-    ``"state"``, ``"chamber"`` (Senate/House), ``"party"``.
+    ``"state"``, ``"chamber"`` (Senate/House), ``"party"``.  The parsed
+    file is cached per modification time, so the member dicts are shared
+    between calls and should not be mutated.
     """
     p = path or CONGRESS_FILE
     if not p.exists():
@@ -31,13 +37,20 @@ def load_congress_members(path: Path | None = None) -> list[dict]:
         return []
 
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        return data if isinstance(data, list) else []
+        st = p.stat()
+        return list(_read_members(str(p), st.st_mtime_ns, st.st_size))
     except (json.JSONDecodeError, OSError) as exc:
         log.warning("Failed to load congress file: %s", exc)
         return []
 
 
+@lru_cache(maxsize=4)
+def _read_members(path: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    """Parse the member file (memoized until its mtime or size changes)."""
+    data = json.loads(Path(path).read_bytes())
+    return tuple(data) if isinstance(data, list) else ()
+
+
 def save_congress_members(members: list[dict], path: Path | None = None) -> None:
     """Save the Congress member list to disk."""
     p = path or CONGRESS_FILE
@@ -46,14 +59,72 @@ def save_congress_members(members: list[dict], path: Path | None = None) -> None
     log.info("Saved %d congress members to %s", len(members), p)
 
 
+_SUFFIX_RE = re.compile(r"\s+(?:jr|sr|iii|ii|iv)\b|,")
+
+
+@lru_cache(maxsize=4096)
 def _normalize_name(name: str) -> str:
     """Normalize a name for fuzzy matching (lowercase, strip suffixes)."""
-    name = name.lower().strip()
-    for suffix in (" jr", " sr", " iii", " ii", " iv", ","):
-        name = name.replace(suffix, "")
+    name = _SUFFIX_RE.sub("", name.lower().strip())
     return " ".join(name.split())  # collapse whitespace
 
 
+class _MemberMatcher:
+    """Substring matcher over normalized Congress member names.
+
+    :meth:`match` returns the raw name of the first member (in list order)
+    whose normalized name is contained in, or contains, the given name --
+    the same answer as testing every member with ``in``, without a Python
+    loop over all members per trade:
+
+    * member in name: each slice of *name* whose length equals some member
+      name length is looked up in a dict (a hashed stand-in for an
+      Aho-Corasick trie, so no extra dependency is needed);
+    * name in member: one ``str.find`` over all member names joined by
+      newlines (normalized names never contain one).
+    """
+
+    def __init__(self, member_lookup: dict[str, str]):
+        self._raw = list(member_lookup.values())
+        self._order = {norm: i for i, norm in enumerate(member_lookup)}
+        self._lengths = sorted({len(norm) for norm in member_lookup})
+        self._joined = "\n".join(member_lookup)
+        self._starts = list(
+            accumulate((len(norm) + 1 for norm in member_lookup), initial=0)
+        )
+
+    def match(self, name: str) -> str | None:
+        best = len(self._raw)
+        n = len(name)
+        order = self._order
+        for length in self._lengths:
+            if length > n:
+                break
+            for start in range(n - length + 1):
+                i = order.get(name[start : start + length])
+                if i is not None and i < best:
+                    best = i
+        pos = self._joined.find(name)
+        if pos >= 0:
+            best = min(best, bisect_right(self._starts, pos) - 1)
+        return self._raw[best] if best < len(self._raw) else None
+
+
+@lru_cache(maxsize=4)
+def _member_index(names: tuple[str, ...]) -> tuple[dict[str, str], _MemberMatcher]:
+    """Build the normalized-name lookup and matcher for a member list.
+
+    Memoized on the raw names, so repeated scans against the same list
+    skip the rebuild.
+    """
+    member_lookup: dict[str, str] = {}
+    for raw_name in names:
+        if raw_name:
+            norm = _normalize_name(raw_name)
+            member_lookup[norm] = raw_name
+    return member_lookup, _MemberMatcher(member_lookup)
+
+
 def flag_congress_trades(
     trades: list[InsiderTrade],
     members: list[dict] | None = None,
@@ -78,29 +149,24 @@ def flag_congress_trades(
     if not members:
         return trades
 
-    # Build lookup set of normalized names
-    member_lookup: dict[str, str] = {}
-    for m in members:
-        raw_name = m.get("name", "")
-        if raw_name:
-            norm = _normalize_name(raw_name)
-            member_lookup[norm] = raw_name
+    member_lookup, matcher = _member_index(tuple(m.get("name", "") for m in members))
 
-    for trade in trades:
-        norm_insider = _normalize_name(trade.insider_name)
+    # Match each distinct insider name once (the same executive usually
+    # files many Form 4s), then apply the result to all of their trades.
+    matches: dict[str, str | None] = {}
+    for name in {t.insider_name for t in trades}:
+        norm_insider = _normalize_name(name)
+        # Exact match, else any member name contained in insider name or vice versa
+        raw_member = member_lookup.get(norm_insider)
+        if raw_member is None:
+            raw_member = matcher.match(norm_insider)
+        matches[name] = raw_member
 
-        # Exact match
-        if norm_insider in member_lookup:
+    for trade in trades:
+        raw_member = matches[trade.insider_name]
+        if raw_member is not None:
             trade.is_congress = True
-            trade.congress_member = member_lookup[norm_insider]
-            continue
-
-        # Partial match: check if any member name is contained in insider name or vice versa
-        for norm_member, raw_member in member_lookup.items():
-            if norm_member in norm_insider or norm_insider in norm_member:
-                trade.is_congress = True
-                trade.congress_member = raw_member
-                break
+            trade.congress_member = raw_member
 
     flagged_count = sum(1 for t in trades if t.is_congress)
     if flagged_count:
@@ -5,11 +5,16 @@ from __future__ import annotations
 import json
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from datetime import date
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from PySide6.QtCore import Qt, QDate, QThreadPool, Slot
+from PySide6.QtCore import Qt, QDate, QSignalBlocker, QThreadPool, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -28,6 +33,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from insider_scanner.core.congress_house import scrape_house_trades
+from insider_scanner.core.congress_senate import scrape_senate_trades
+from insider_scanner.core.models import CongressTrade
 from insider_scanner.gui.widgets import SortableTableModel
 from insider_scanner.utils.threading import Worker
 
@@ -43,6 +51,11 @@ SECTORS = [
     "Other",
 ]
 
+# DataFrame columns, in CongressTrade.to_dict() order
+_DF_COLUMNS = tuple(f.name for f in fields(CongressTrade))
+_DATE_COLUMNS = ("filing_date", "trade_date")
+_AMOUNT_COLUMNS = ("amount_low", "amount_high")
+
 # Congress trade table columns for display
 DISPLAY_COLUMNS = [
     "filing_date",
@@ -64,52 +77,90 @@ def _load_congress_names() -> list[str]:
     Returns a sorted list of display names (e.g. "Pelosi Nancy").
     The first entry is always "All" to allow scanning all members.
     """
-    from insider_scanner.utils.config import CONGRESS_FILE
-
-    names = []
-    if CONGRESS_FILE.exists():
-        try:
-            data = json.loads(CONGRESS_FILE.read_text(encoding="utf-8"))
-            for entry in data:
-                # Support both simple {"name": ...} and extended formats
-                name = entry.get("official_name") or entry.get("name", "")
-                if name:
-                    names.append(name)
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-    names.sort()
-    return ["All"] + names
+    names, _ = _congress_file_data()
+    return ["All", *names]
 
 
 def _load_member_sectors() -> dict[str, list[str]]:
     """Load official_name → sector list mapping from congress_members.json.
 
-    Returns a dict like {"Pelosi Nancy": ["Finance"], ...}.
+    Returns a dict like {"Pelosi Nancy": ["Finance"], ...}.  The mapping is
+    cached until the file changes, so callers must not mutate it.
     """
+    _, mapping = _congress_file_data()
+    return mapping
+
+
+def _congress_file_data() -> tuple[tuple[str, ...], dict[str, list[str]]]:
+    """Return (sorted names, name → sectors) for the current CONGRESS_FILE."""
     from insider_scanner.utils.config import CONGRESS_FILE
 
+    if not CONGRESS_FILE.exists():
+        return (), {}
+    st = CONGRESS_FILE.stat()
+    return _parse_congress_file(str(CONGRESS_FILE), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _parse_congress_file(
+    path: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, ...], dict[str, list[str]]]:
+    """Decode the member file into names and sectors in a single pass.
+
+    Memoized on the file's mtime and size: tab init, list refreshes and
+    every scan reuse the parsed data until the file is rewritten.
+    """
+    names: list[str] = []
     mapping: dict[str, list[str]] = {}
-    if CONGRESS_FILE.exists():
-        try:
-            data = json.loads(CONGRESS_FILE.read_text(encoding="utf-8"))
-            for entry in data:
-                name = entry.get("official_name") or entry.get("name", "")
+    try:
+        data = json.loads(Path(path).read_bytes())
+        for entry in data:
+            # Support both simple {"name": ...} and extended formats
+            name = entry.get("official_name") or entry.get("name", "")
+            if name:
+                names.append(name)
                 sector = entry.get("sector", ["Other"])
                 if isinstance(sector, str):
                     sector = [sector]
-                if name:
-                    mapping[name] = sector
-        except (json.JSONDecodeError, KeyError):
-            pass
-    return mapping
+                mapping[name] = sector
+    except (json.JSONDecodeError, KeyError):
+        pass
+
+    names.sort()
+    return tuple(names), mapping
+
+
+def _sector_members(
+    sector: str, member_sectors: dict[str, list[str]]
+) -> frozenset[str]:
+    """Officials whose sector list contains *sector*.
+
+    Inverting the mapping once per filter call turns the per-trade check
+    into a set lookup instead of a dict lookup plus list scan.
+    """
+    return frozenset(
+        name for name, sectors in member_sectors.items() if sector in sectors
+    )
 
 
 def congress_trades_to_dataframe(trades: list) -> pd.DataFrame:
     """Convert a list of CongressTrade to a pandas DataFrame."""
     if not trades:
         return pd.DataFrame()
-    return pd.DataFrame([t.to_dict() for t in trades])
+    # Columnar build straight from attributes: no per-trade to_dict()
+    # and no row → column transpose.
+    columns: dict[str, list | np.ndarray] = {}
+    for name in _DF_COLUMNS:
+        values = map(attrgetter(name), trades)
+        if name in _DATE_COLUMNS:
+            columns[name] = [str(d) if d else "" for d in values]
+        elif name in _AMOUNT_COLUMNS:
+            # float64 whatever numeric type a trade carries, so min_value
+            # masks are one numpy comparison
+            columns[name] = np.fromiter(values, dtype=np.float64, count=len(trades))
+        else:
+            columns[name] = list(values)
+    return pd.DataFrame(columns)
 
 
 def filter_congress_trades(
@@ -139,28 +190,86 @@ def filter_congress_trades(
     member_sectors : dict or None
         Mapping of official_name → list of sector strings.
     """
-    result = trades
+    if min_value is not None and min_value <= 0:
+        min_value = None
+
+    by_sector = False
+    names: frozenset[str] = frozenset()
+    mapped: dict[str, list[str]] = {}
+    if sector and sector != "All" and member_sectors:
+        by_sector = True
+        names = _sector_members(sector, member_sectors)
+        mapped = member_sectors
+    # Officials missing from the mapping count as "Other"
+    unmapped_ok = by_sector and sector == "Other"
+
+    # One pass; inactive filters short-circuit on their first operand
+    return [
+        t
+        for t in trades
+        if (not trade_type or t.trade_type == trade_type)
+        and (min_value is None or t.amount_low >= min_value)
+        and (not since or (t.filing_date and t.filing_date >= since))
+        and (not until or (t.filing_date and t.filing_date <= until))
+        and (
+            not by_sector
+            or t.official_name in names
+            or (unmapped_ok and t.official_name not in mapped)
+        )
+    ]
+
+
+def congress_filter_mask(
+    df: pd.DataFrame,
+    *,
+    trade_type: str | None = None,
+    min_value: float | None = None,
+    since: date | None = None,
+    until: date | None = None,
+    sector: str | None = None,
+    member_sectors: dict[str, list[str]] | None = None,
+) -> np.ndarray:
+    """Boolean row mask over a congress DataFrame, same rules as
+    :func:`filter_congress_trades`.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Output of :func:`congress_trades_to_dataframe`.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``bool`` array of length ``len(df)``; ``True`` rows pass every
+        active filter.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if df.empty:
+        return mask
 
     if trade_type:
-        result = [t for t in result if t.trade_type == trade_type]
+        mask &= (df["trade_type"] == trade_type).to_numpy()
 
     if min_value is not None and min_value > 0:
-        result = [t for t in result if t.amount_low >= min_value]
+        mask &= df["amount_low"].to_numpy() >= min_value
 
+    # filing_date holds ISO strings ("" when unknown), which compare like dates
     if since:
-        result = [t for t in result if t.filing_date and t.filing_date >= since]
+        mask &= (df["filing_date"] >= since.isoformat()).to_numpy()
 
     if until:
-        result = [t for t in result if t.filing_date and t.filing_date <= until]
+        filed = df["filing_date"]
+        mask &= ((filed != "") & (filed <= until.isoformat())).to_numpy()
 
     if sector and sector != "All" and member_sectors:
-        result = [
-            t
-            for t in result
-            if sector in member_sectors.get(t.official_name, ["Other"])
-        ]
+        names = _sector_members(sector, member_sectors)
+        in_sector = df["official_name"].isin(names).to_numpy()
+        if sector == "Other":
+            # Officials missing from the mapping count as "Other"
+            in_sector = in_sector | ~df["official_name"].isin(member_sectors).to_numpy()
+        mask &= in_sector
 
-    return result
+    return mask
 
 
 def save_congress_results(
@@ -177,15 +286,22 @@ def save_congress_results(
     out = SCAN_OUTPUTS_DIR
     out.mkdir(parents=True, exist_ok=True)
 
+    # One to_dict() pass feeds both writers
+    records = [t.to_dict() for t in trades]
+
     # CSV
-    df = congress_trades_to_dataframe(trades)
+    df = pd.DataFrame(records) if records else pd.DataFrame()
     csv_path = out / f"{label}.csv"
     df.to_csv(csv_path, index=False)
 
-    # JSON
+    # JSON: one record per line inside the array.  Encoding each record
+    # compactly takes the C encoder; indent=2 forces the pure-Python one.
     json_path = out / f"{label}.json"
-    with open(json_path, "w") as f:
-        json.dump([t.to_dict() for t in trades], f, indent=2, default=str)
+    encode = json.JSONEncoder(default=str).encode
+    with open(json_path, "w", buffering=1 << 20) as f:
+        f.write("[\n")
+        f.write(",\n".join(map(encode, records)))
+        f.write("\n]\n")
 
     return out
 
@@ -197,6 +313,7 @@ class CongressTab(QWidget):
         super().__init__(parent)
         self._trades: list = []
         self._filtered_trades: list = []
+        self._df_all = pd.DataFrame()
         self._cancel_event = threading.Event()
         self._member_sectors: dict[str, list[str]] = {}
         self._build_ui()
@@ -210,7 +327,8 @@ class CongressTab(QWidget):
 
         official_l.addWidget(QLabel("Official:"))
         self.official_combo = QComboBox()
-        self.official_combo.addItems(_load_congress_names())
+        self._member_names = _load_congress_names()
+        self.official_combo.addItems(self._member_names)
         self.official_combo.setMinimumWidth(250)
         self.official_combo.setEditable(True)
         self.official_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
@@ -335,9 +453,12 @@ class CongressTab(QWidget):
         self.trades_table.setModel(self.trades_model)
         self.trades_table.setSortingEnabled(True)
         self.trades_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
-        self.trades_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.ResizeToContents
-        )
+        # Columns are fitted once per load (see _display_trades) from a
+        # sample of rows; ResizeToContents would re-measure every row on
+        # each reset, sort and relayout.
+        header = self.trades_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setResizeContentsPrecision(100)
         self.trades_table.doubleClicked.connect(self._on_row_double_click)
         table_l.addWidget(self.trades_table)
 
@@ -381,24 +502,28 @@ class CongressTab(QWidget):
     def _get_start_date(self) -> date | None:
         if not self.chk_use_dates.isChecked():
             return None
-        qd = self.start_date.date()
-        return date(qd.year(), qd.month(), qd.day())
+        return self.start_date.date().toPython()
 
     def _get_end_date(self) -> date | None:
         if not self.chk_use_dates.isChecked():
             return None
-        qd = self.end_date.date()
-        return date(qd.year(), qd.month(), qd.day())
+        return self.end_date.date().toPython()
 
     def _refresh_member_list(self):
         """Reload congress_members.json and repopulate the dropdown."""
-        current = self.official_combo.currentText()
-        self.official_combo.clear()
         names = _load_congress_names()
-        self.official_combo.addItems(names)
-        idx = self.official_combo.findText(current)
-        if idx >= 0:
-            self.official_combo.setCurrentIndex(idx)
+        if names == self._member_names:
+            return  # file unchanged: keep the items and the typed text
+        self._member_names = names
+
+        current = self.official_combo.currentText()
+        # One batch rebuild without intermediate change notifications
+        with QSignalBlocker(self.official_combo):
+            self.official_combo.clear()
+            self.official_combo.addItems(names)
+            idx = self.official_combo.findText(current)
+            if idx >= 0:
+                self.official_combo.setCurrentIndex(idx)
 
     def _set_scan_buttons_enabled(self, enabled: bool):
         """Toggle scan-related buttons."""
@@ -451,31 +576,23 @@ class CongressTab(QWidget):
         )
 
         def work():
-            from insider_scanner.core.congress_house import (
-                scrape_house_trades,
-            )
-            from insider_scanner.core.congress_senate import (
-                scrape_senate_trades,
-            )
+            scrapers = []
+            if use_house:
+                scrapers.append(scrape_house_trades)
+            if use_senate:
+                scrapers.append(scrape_senate_trades)
+            if cancel.is_set():
+                return []
+
+            # House and Senate are separate sites: fetch them concurrently
+            # so the scan takes as long as the slower one, not both.
+            kwargs = {"official_name": official_name, "date_from": sd, "date_to": ed}
+            with ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+                futures = [pool.submit(fn, **kwargs) for fn in scrapers]
 
             all_trades = []
-
-            if use_house and not cancel.is_set():
-                house_trades = scrape_house_trades(
-                    official_name=official_name,
-                    date_from=sd,
-                    date_to=ed,
-                )
-                all_trades.extend(house_trades)
-
-            if use_senate and not cancel.is_set():
-                senate_trades = scrape_senate_trades(
-                    official_name=official_name,
-                    date_from=sd,
-                    date_to=ed,
-                )
-                all_trades.extend(senate_trades)
-
+            for future in futures:
+                all_trades.extend(future.result())
             return all_trades
 
         worker = Worker(work)
@@ -489,10 +606,12 @@ class CongressTab(QWidget):
         self._cancel_event.clear()
         self._trades = trades
         self._filtered_trades = trades
+        # Built once per scan; Apply Filters only masks rows of this frame
+        self._df_all = congress_trades_to_dataframe(trades)
         self.progress.setVisible(False)
         self._set_scan_buttons_enabled(True)
         self.btn_save.setEnabled(bool(trades))
-        self._display_trades(trades)
+        self._display_trades(trades, self._df_all)
         if cancelled:
             self.status_label.setText(
                 self.status_label.text() + "  (scan was cancelled)"
@@ -510,18 +629,20 @@ class CongressTab(QWidget):
     # Display + filter
     # ------------------------------------------------------------------
 
-    def _display_trades(self, trades):
+    def _display_trades(self, trades, df: pd.DataFrame | None = None):
         if not trades:
             self.status_label.setText("No trades found.")
             self.trades_model.set_dataframe(pd.DataFrame())
             self.btn_open_filing.setEnabled(False)
             return
 
-        df = congress_trades_to_dataframe(trades)
+        if df is None:
+            df = congress_trades_to_dataframe(trades)
 
         # Select display columns that exist
         cols = [c for c in DISPLAY_COLUMNS if c in df.columns]
         self.trades_model.set_dataframe(df[cols])
+        self.trades_table.resizeColumnsToContents()
         self.status_label.setText(f"{len(trades)} congress trades found")
 
     def _apply_filters(self):
@@ -538,8 +659,8 @@ class CongressTab(QWidget):
         if sector == "All":
             sector = None
 
-        self._filtered_trades = filter_congress_trades(
-            self._trades,
+        mask = congress_filter_mask(
+            self._df_all,
             trade_type=trade_type,
             min_value=min_val if min_val > 0 else None,
             since=self._get_start_date(),
@@ -547,7 +668,13 @@ class CongressTab(QWidget):
             sector=sector,
             member_sectors=self._member_sectors,
         )
-        self._display_trades(self._filtered_trades)
+        # Keep trades aligned with table rows for detail/open-filing lookups
+        rows = np.flatnonzero(mask).tolist()
+        self._filtered_trades = [self._trades[i] for i in rows]
+        # Take rows and visible columns together so hidden columns are
+        # never copied; df[cols] itself is a copy-on-write view.
+        cols = [c for c in DISPLAY_COLUMNS if c in self._df_all.columns]
+        self._display_trades(self._filtered_trades, self._df_all.loc[mask, cols])
         self.btn_save.setEnabled(bool(self._filtered_trades))
 
     # ------------------------------------------------------------------
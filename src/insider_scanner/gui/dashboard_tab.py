@@ -8,12 +8,13 @@ All data is fetched by a SINGLE background Worker calling
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 from typing import Dict, List
 
 import numpy as np
 import pandas as pd
 import pyqtgraph as pg
-from PySide6.QtCore import QThreadPool, Slot, QTimer
+from PySide6.QtCore import Qt, QThreadPool, Slot, QTimer
 from PySide6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
@@ -37,6 +38,16 @@ from insider_scanner.utils.threading import Worker
 
 log = logging.getLogger(__name__)
 
+# Card backgrounds (RGBA): unavailable, price up, price down
+_NA_BG = (80, 80, 80, 120)
+_POS_BG = (60, 160, 80, 160)
+_NEG_BG = (180, 40, 40, 160)
+
+
+def _same_objects(a: dict, b: dict | None) -> bool:
+    """True when *b* maps exactly the keys of *a* to the very same objects."""
+    return b is not None and a.keys() == b.keys() and all(a[k] is b[k] for k in a)
+
 
 class DashboardTab(QWidget):
     """Live-updating dashboard with prices, VIX chart, F&G, and indicators."""
@@ -55,6 +66,24 @@ class DashboardTab(QWidget):
         self._refreshing: bool = False
         self._refresh_queued: bool = False
 
+        # One re-armable worker, connected once.  The worker always emits
+        # from a pool thread: queue explicitly instead of letting
+        # AutoConnection decide on every emit.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._worker = Worker(provider.fetch_all)
+        self._worker.setAutoDelete(False)
+        self._worker.signals.result.connect(self._on_snapshot, queued)
+        self._worker.signals.error.connect(self._on_error, queued)
+        self._worker.signals.finished.connect(self._on_finished, queued)
+
+        # Last VIX series handed to the curve, and its
+        # (first x, last x, min y, max y) extent
+        self._vix_series: pd.Series | None = None
+        self._vix_extent: tuple | None = None
+
+        # Snapshot sections last applied to the cards ("prices", "fg", "ind")
+        self._last_payload: dict = {}
+
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -134,6 +163,12 @@ class DashboardTab(QWidget):
             r, c = divmod(i, cols)
             right_grid.addWidget(card, r, c)
 
+        # (spec, card, unit suffix) in display order, walked on every refresh
+        self._ind_items = tuple(
+            (spec, self.ind_cards[spec.key], f" {spec.unit}".rstrip())
+            for spec in self.indicator_specs
+        )
+
         right_widget = QWidget()
         right_widget.setLayout(right_grid)
 
@@ -141,8 +176,10 @@ class DashboardTab(QWidget):
         split.addWidget(right_widget, 1)
         root.addLayout(split)
 
-        # Auto-refresh timer
+        # Auto-refresh timer.  Single-shot and re-armed when a refresh
+        # finishes, so the 60 s window never overlaps a slow fetch.
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
         self._timer.setInterval(60_000)
         self._timer.timeout.connect(self.refresh_async)
         self._timer.start()
@@ -157,7 +194,9 @@ class DashboardTab(QWidget):
 
         If a refresh is already running, the request is queued and
         executes when the current one finishes.  Only ONE worker runs
-        at a time, which avoids yfinance thread-safety issues.
+        at a time, which avoids yfinance thread-safety issues.  The
+        auto-refresh timer is paused while a worker runs, so only
+        explicit calls can queue.
         """
         if self._refreshing:
             self._refresh_queued = True
@@ -169,20 +208,18 @@ class DashboardTab(QWidget):
         """Launch the single background worker."""
         self._refreshing = True
         self._refresh_queued = False
-
-        worker = Worker(self.provider.fetch_all)
-        worker.signals.result.connect(self._on_snapshot)
-        worker.signals.error.connect(self._on_error)
-        worker.signals.finished.connect(self._on_finished)
-        QThreadPool.globalInstance().start(worker)
+        self._timer.stop()
+        self._worker.reset(self.provider.fetch_all)
+        QThreadPool.globalInstance().start(self._worker)
 
     @Slot()
     def _on_finished(self):
-        """Worker done — run queued refresh if one was requested."""
+        """Worker done — run queued refresh or schedule the next tick."""
         self._refreshing = False
         if self._refresh_queued:
-            self._refresh_queued = False
             self._start_refresh()
+        else:
+            self._timer.start()
 
     @Slot(object)
     def _on_snapshot(self, snapshot: object):
@@ -190,19 +227,32 @@ class DashboardTab(QWidget):
         if not isinstance(snapshot, DashboardSnapshot):
             return
 
-        # Prices
-        for symbol, card in self.top_cards.items():
-            s = snapshot.prices.get(symbol, pd.Series(dtype=float))
-            self._apply_price(card, s)
+        with self._paint_once():
+            # Sections whose payload matches the previous tick are skipped: the
+            # provider's TTL cache returns the same objects until expiry.
+            last = self._last_payload
+
+            # Prices
+            if not _same_objects(snapshot.prices, last.get("prices")):
+                for symbol, card in self.top_cards.items():
+                    self._apply_price(card, snapshot.prices.get(symbol))
+
+            # VIX chart
+            self._apply_vix(snapshot.vix)
 
-        # VIX chart
-        self._apply_vix(snapshot.vix)
+            # Fear & Greed
+            if snapshot.fear_greed != last.get("fg"):
+                self._apply_fg(snapshot.fear_greed)
 
-        # Fear & Greed
-        self._apply_fg(snapshot.fear_greed)
+            # Indicators
+            if snapshot.indicators != last.get("ind"):
+                self._apply_indicators(snapshot.indicators)
 
-        # Indicators
-        self._apply_indicators(snapshot.indicators)
+            self._last_payload = {
+                "prices": snapshot.prices,
+                "fg": snapshot.fear_greed,
+                "ind": snapshot.indicators,
+            }
 
     @Slot(tuple)
     def _on_error(self, exc_info: tuple):
@@ -212,47 +262,60 @@ class DashboardTab(QWidget):
             exc_type.__name__,
             exc_value,
         )
-        # Set all cards to n/a
-        for card in self.top_cards.values():
-            card.set_value(None, None, self._NA_BG)
-        self.vix_curve.setData([], [])
-        for card in self.fg_cards.values():
-            card.set_value("n/a", "data unavailable", self._NA_BG)
-        for spec in self.indicator_specs:
-            self.ind_cards[spec.key].set_value(
-                "n/a",
-                "data unavailable",
-                self._NA_BG,
-            )
+        with self._paint_once():
+            # Set all cards to n/a
+            self._last_payload = {}
+            for card in self.top_cards.values():
+                card.set_value(None, None, _NA_BG)
+            self._vix_series = None
+            self._clear_vix()
+            for card in self.fg_cards.values():
+                card.set_value("n/a", "data unavailable", _NA_BG)
+            for _, card, _ in self._ind_items:
+                card.set_value("n/a", "data unavailable", _NA_BG)
 
     # ------------------------------------------------------------------
     # Apply helpers
     # ------------------------------------------------------------------
 
-    _NA_BG = (80, 80, 80, 120)
-
-    def _apply_price(self, card: PriceChangeCard, s: pd.Series):
-        if s is None or len(s) < 2:
-            card.set_value(None, None, self._NA_BG)
+    @contextmanager
+    def _paint_once(self):
+        """Hold repaints while many cards change; one repaint at the end."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)  # also schedules update()
+
+    def _apply_price(self, card: PriceChangeCard, s: pd.Series | None):
+        # Positional reads on the backing ndarray skip the iloc indexer
+        arr = s.to_numpy() if s is not None else None
+        if arr is None or arr.size < 2:
+            card.set_value(None, None, _NA_BG)
             return
 
-        last = float(s.iloc[-1])
-        prev = float(s.iloc[-2])
+        last = float(arr[-1])
+        prev = float(arr[-2])
         pct = (last / prev - 1.0) * 100.0
-        bg = (60, 160, 80, 160) if pct >= 0 else (180, 40, 40, 160)
+        bg = _POS_BG if pct >= 0 else _NEG_BG
         card.set_value(last, pct, bg)
 
     def _apply_vix(self, s: pd.Series):
+        if s is not None and s is self._vix_series:
+            # Provider served the same cached Series: the curve is current
+            return
+        self._vix_series = s
+
         if s is None or s.empty:
-            self.vix_curve.setData([], [])
+            self._clear_vix()
             return
 
-        # Convert tz-aware DatetimeIndex → POSIX seconds (float64).
-        # Using .astype("int64") is safer than .view("int64") across
-        # pandas versions and timezone-aware indices.
-        try:
-            x = s.index.astype("int64").to_numpy(dtype=np.float64) / 1e9
-        except (TypeError, AttributeError):
+        # DatetimeIndex → POSIX seconds (float64).  pandas 3 may store
+        # datetimes in us rather than ns, so pin the unit before reading
+        # the integer epoch via asi8 (no copy when already ns).
+        if isinstance(s.index, pd.DatetimeIndex):
+            x = s.index.as_unit("ns").asi8 / 1e9
+        else:
             # Fallback for unusual index types
             x = np.array(
                 [ts.timestamp() for ts in s.index],
@@ -261,24 +324,37 @@ class DashboardTab(QWidget):
         y = s.to_numpy(dtype=np.float64)
 
         self.vix_curve.setData(x, y)
-        self.vix_plot.getPlotItem().vb.autoRange()
+        # Re-fit the view only when the data extent moved, so an unchanged
+        # refresh neither repaints the axes nor resets the user's pan/zoom.
+        # The extent comes from the arrays (x is sorted), so set it directly
+        # rather than letting autoRange() rediscover item bounds.
+        extent = (x[0], x[-1], np.nanmin(y), np.nanmax(y))
+        if extent != self._vix_extent:
+            self._vix_extent = extent
+            x0, x1, y0, y1 = extent
+            self.vix_plot.getPlotItem().vb.setRange(xRange=(x0, x1), yRange=(y0, y1))
+
+    def _clear_vix(self):
+        # No extent means the curve holds no data yet: nothing to clear
+        if self._vix_extent is None:
+            return
+        self.vix_curve.setData([], [])
+        self._vix_extent = None
 
     def _apply_fg(self, fg: dict):
         for k, card in self.fg_cards.items():
             val = fg.get(k)
             if not val:
-                card.set_value("n/a", "data unavailable", self._NA_BG)
+                card.set_value("n/a", "data unavailable", _NA_BG)
                 continue
             value, label = val
             card.set_value(str(int(value)), str(label), fg_color(int(value)))
 
     def _apply_indicators(self, values: dict):
-        for spec in self.indicator_specs:
-            card = self.ind_cards[spec.key]
+        for spec, card, suffix in self._ind_items:
             v = values.get(spec.key)
             if v is None:
-                card.set_value("n/a", "data unavailable", self._NA_BG)
+                card.set_value("n/a", "data unavailable", _NA_BG)
                 continue
             color = indicator_color(float(v), spec.bands)
-            suffix = f" {spec.unit}".rstrip()
             card.set_value(f"{v}{suffix}", "", color)
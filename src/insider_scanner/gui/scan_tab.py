@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from copy import copy
 from datetime import date
 from threading import Event
 
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import Qt, QDate, QThreadPool, Slot
 from PySide6.QtWidgets import (
@@ -32,12 +36,131 @@ from insider_scanner.gui.widgets import SortableTableModel
 from insider_scanner.utils.threading import Worker
 
 
+DISPLAY_COLUMNS = [
+    "filing_date",
+    "trade_date",
+    "ticker",
+    "insider_name",
+    "insider_title",
+    "trade_type",
+    "shares",
+    "price",
+    "value",
+    "source",
+    "edgar_url",
+]
+
+
+def trade_filter_mask(
+    df: pd.DataFrame,
+    *,
+    trade_type: str | None = None,
+    min_value: float | None = None,
+    congress_only: bool = False,
+    since: date | None = None,
+    until: date | None = None,
+) -> np.ndarray:
+    """Boolean row mask over a trades DataFrame, same rules as
+    :func:`~insider_scanner.core.merger.filter_trades`.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Output of :func:`~insider_scanner.core.merger.trades_to_dataframe`.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``bool`` array of length ``len(df)``; ``True`` rows pass every
+        active filter.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if df.empty:
+        return mask
+
+    if trade_type:
+        mask &= (df["trade_type"] == trade_type).to_numpy()
+
+    if min_value is not None:
+        mask &= np.abs(df["value"].to_numpy(dtype=np.float64)) >= min_value
+
+    if congress_only:
+        mask &= df["is_congress"].to_numpy(dtype=bool)
+
+    # filing_date holds ISO strings ("" when unknown), which compare like dates
+    if since:
+        mask &= (df["filing_date"] >= since.isoformat()).to_numpy()
+
+    if until:
+        filed = df["filing_date"]
+        mask &= ((filed != "") & (filed <= until.isoformat())).to_numpy()
+
+    return mask
+
+
+def _scrape_watchlist(
+    tickers,
+    scrapers,
+    *,
+    start_date=None,
+    end_date=None,
+    cancel: Event | None = None,
+    on_progress=None,
+    on_ticker=None,
+):
+    """Run every scraper over every ticker concurrently.
+
+    *scrapers* is a sequence of ``(scrape_fn, max_workers)`` pairs.  Each
+    scraper gets its own pool of *max_workers* threads, which caps the
+    concurrent requests hitting that site.  Tickers not yet started
+    when *cancel* is set yield empty lists.  Whenever all sources of a
+    ticker have finished, *on_ticker* is called with that ticker's trade
+    lists (in scraper order) and *on_progress* with the number of
+    tickers finished so far.
+
+    Returns the trade lists ordered by ticker, then by scraper.
+    """
+
+    def scrape_one(scraper, ticker):
+        if cancel is not None and cancel.is_set():
+            return []
+        return scraper(ticker, start_date=start_date, end_date=end_date)
+
+    results = {}
+    pending = [len(scrapers)] * len(tickers)
+    done = 0
+    with ExitStack() as stack:
+        futures = {}
+        for j, (scraper, max_workers) in enumerate(scrapers):
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+            for i, ticker in enumerate(tickers):
+                futures[pool.submit(scrape_one, scraper, ticker)] = (i, j)
+
+        for future in as_completed(futures):
+            i, j = futures[future]
+            results[i, j] = future.result()
+            pending[i] -= 1
+            if not pending[i]:
+                done += 1
+                if on_ticker is not None:
+                    on_ticker([results[i, k] for k in range(len(scrapers))])
+                if on_progress is not None:
+                    on_progress(done)
+
+    return [results[key] for key in sorted(results)]
+
+
 class ScanTab(QWidget):
     """Full scan workflow: enter ticker → select sources → scan → view → EDGAR."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._trades: list = []
+        self._filtered_trades: list = []
+        self._df_all = pd.DataFrame()
+        # Frames of streamed rows not yet concatenated into _df_all
+        self._df_parts: list[pd.DataFrame] = []
+        self._congress_count = 0
         self._cancel_event = Event()
         self._build_ui()
 
@@ -179,9 +302,12 @@ class ScanTab(QWidget):
         self.trades_table.setModel(self.trades_model)
         self.trades_table.setSortingEnabled(True)
         self.trades_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
-        self.trades_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.ResizeToContents
-        )
+        # Columns are fitted once per load (see _display_trades) from a
+        # sample of rows; ResizeToContents would re-measure every row on
+        # each reset, sort and relayout.
+        header = self.trades_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setResizeContentsPrecision(100)
         self.trades_table.doubleClicked.connect(self._on_row_double_click)
         table_l.addWidget(self.trades_table)
 
@@ -228,14 +354,12 @@ class ScanTab(QWidget):
     def _get_start_date(self) -> date | None:
         if not self.chk_use_dates.isChecked():
             return None
-        qd = self.start_date.date()
-        return date(qd.year(), qd.month(), qd.day())
+        return self.start_date.date().toPython()
 
     def _get_end_date(self) -> date | None:
         if not self.chk_use_dates.isChecked():
             return None
-        qd = self.end_date.date()
-        return date(qd.year(), qd.month(), qd.day())
+        return self.end_date.date().toPython()
 
     # ------------------------------------------------------------------
     # Scan
@@ -344,38 +468,99 @@ class ScanTab(QWidget):
             from insider_scanner.core.secform4 import scrape_ticker as sf4
             from insider_scanner.core.openinsider import scrape_ticker as oi
             from insider_scanner.core.merger import merge_trades
-            from insider_scanner.core.senate import flag_congress_trades
+            from insider_scanner.core.senate import (
+                flag_congress_trades,
+                load_congress_members,
+            )
 
-            all_lists = []
-            for i, ticker in enumerate(tickers):
-                if cancel.is_set():
-                    break
-                lists = []
-                if use_sf4:
-                    lists.append(sf4(ticker, start_date=sd, end_date=ed))
-                if use_oi:
-                    lists.append(oi(ticker, start_date=sd, end_date=ed))
-                all_lists.extend(lists)
+            members = load_congress_members()
+
+            def stream(lists):
+                # Rows for one ticker, shown while the rest still download.
+                # The GUI gets copies plus a ready frame, so it never touches
+                # objects this thread still merges for the final result.
+                trades = merge_trades(*lists)
+                if trades:
+                    flag_congress_trades(trades, members)
+                    shown = [copy(t) for t in trades]
+                    worker.emit_partial((shown, ScanTab._trades_frame(shown)))
+
+            # Both sites are scraped concurrently; each ticker's trades and
+            # progress are reported as soon as all its sources complete.
+            # secform4 requests are not rate limited by fetch_url, so that
+            # site gets a single worker: one request in flight at a time.
+            scrapers = []
+            if use_sf4:
+                scrapers.append((sf4, 1))
+            if use_oi:
+                scrapers.append((oi, 4))
+            all_lists = _scrape_watchlist(
+                tickers,
+                scrapers,
+                start_date=sd,
+                end_date=ed,
+                cancel=cancel,
+                on_progress=worker.emit_progress,
+                on_ticker=stream,
+            )
 
             merged = merge_trades(*all_lists)
-            flag_congress_trades(merged)
+            flag_congress_trades(merged, members)
             return merged
 
+        # Streamed rows accumulate here until the final merged result
+        self._trades = []
+        self._filtered_trades = self._trades
+        self._df_all = pd.DataFrame()
+        self._df_parts = []
+        self._congress_count = 0
+
         worker = Worker(work)
+        worker.signals.partial.connect(self._append_trades)
+        worker.signals.progress.connect(self.progress.setValue)
         worker.signals.result.connect(self._on_scan_done)
         worker.signals.error.connect(self._on_scan_error)
         QThreadPool.globalInstance().start(worker)
 
+    @Slot(object)
+    def _append_trades(self, batch):
+        """Show one ticker's streamed trades below those already listed."""
+        trades, df = batch
+        self._trades.extend(trades)
+        # Concatenated only when the full frame is needed (_all_frame)
+        self._df_parts.append(df)
+        display_cols = [c for c in DISPLAY_COLUMNS if c in df.columns]
+        self.trades_model.append_dataframe(df[display_cols])
+        self._congress_count += sum(1 for t in trades if t.is_congress)
+        self.status_label.setText(
+            f"{len(self._trades)} trades found  |  "
+            f"{self._congress_count} congress-flagged"
+        )
+
+    def _all_frame(self) -> pd.DataFrame:
+        """Frame of all trades, including rows streamed in so far."""
+        if self._df_parts:
+            parts = self._df_parts
+            if len(self._df_all):
+                parts = [self._df_all, *parts]
+            self._df_all = pd.concat(parts, ignore_index=True)
+            self._df_parts = []
+        return self._df_all
+
     @Slot(object)
     def _on_scan_done(self, trades):
         cancelled = self._cancel_event.is_set()
         self._cancel_event.clear()
         self._trades = trades
+        self._filtered_trades = trades
+        # Built once per scan; Apply Filters only masks rows of this frame
+        self._df_all = self._trades_frame(trades)
+        self._df_parts = []
         self.progress.setVisible(False)
         self.btn_stop.setEnabled(True)
         self._set_scan_buttons_enabled(True)
         self.btn_save.setEnabled(True)
-        self._display_trades(trades)
+        self._display_trades(trades, self._df_all)
         if cancelled:
             self.status_label.setText(
                 self.status_label.text() + "  (scan was cancelled)"
@@ -394,7 +579,8 @@ class ScanTab(QWidget):
     # Display + filter
     # ------------------------------------------------------------------
 
-    def _display_trades(self, trades):
+    @staticmethod
+    def _trades_frame(trades) -> pd.DataFrame:
         from insider_scanner.core.merger import trades_to_dataframe
         from insider_scanner.core.edgar import build_edgar_url_for_trade
 
@@ -403,31 +589,20 @@ class ScanTab(QWidget):
             if not trade.edgar_url:
                 trade.edgar_url = build_edgar_url_for_trade(trade)
 
-        df = trades_to_dataframe(trades)
+        return trades_to_dataframe(trades)
+
+    def _display_trades(self, trades, df: pd.DataFrame | None = None):
+        if df is None:
+            df = self._trades_frame(trades)
         if df.empty:
             self.status_label.setText("No trades found.")
             self.trades_model.set_dataframe(pd.DataFrame())
             return
 
         # Select display columns
-        display_cols = [
-            c
-            for c in [
-                "filing_date",
-                "trade_date",
-                "ticker",
-                "insider_name",
-                "insider_title",
-                "trade_type",
-                "shares",
-                "price",
-                "value",
-                "source",
-                "edgar_url",
-            ]
-            if c in df.columns
-        ]
+        display_cols = [c for c in DISPLAY_COLUMNS if c in df.columns]
         self.trades_model.set_dataframe(df[display_cols])
+        self.trades_table.resizeColumnsToContents()
         congress_count = sum(1 for t in trades if t.is_congress)
         self.status_label.setText(
             f"{len(trades)} trades found  |  {congress_count} congress-flagged"
@@ -437,8 +612,6 @@ class ScanTab(QWidget):
         if not self._trades:
             return
 
-        from insider_scanner.core.merger import filter_trades
-
         trade_type = self.type_combo.currentText()
         if trade_type == "All":
             trade_type = None
@@ -447,25 +620,33 @@ class ScanTab(QWidget):
         if min_val == 0:
             min_val = None
 
-        filtered = filter_trades(
-            self._trades,
+        df_all = self._all_frame()
+        mask = trade_filter_mask(
+            df_all,
             trade_type=trade_type,
             min_value=min_val,
             congress_only=self.chk_congress.isChecked(),
             since=self._get_start_date(),
             until=self._get_end_date(),
         )
-        self._display_trades(filtered)
+        # Keep trades aligned with table rows for detail/EDGAR lookups
+        rows = np.flatnonzero(mask).tolist()
+        self._filtered_trades = [self._trades[i] for i in rows]
+        # Take rows and visible columns together so hidden columns are
+        # never copied.
+        cols = [c for c in DISPLAY_COLUMNS if c in df_all.columns]
+        self._display_trades(self._filtered_trades, df_all.loc[mask, cols])
 
     # ------------------------------------------------------------------
     # EDGAR + details
     # ------------------------------------------------------------------
 
     def _on_row_double_click(self, index):
-        row = index.row()
         source_index = self.trades_model.mapToSource(index)
-        if row < len(self._trades):
-            trade = self._trades[source_index.row()]
+        row = source_index.row()
+        trades = self._filtered_trades or self._trades
+        if row < len(trades):
+            trade = trades[row]
             detail = (
                 f"Name: {trade.insider_name}  |  Title: {trade.insider_title}\n"
                 f"Type: {trade.trade_type}  |  Shares: {trade.shares:,.0f}  |  "
@@ -485,8 +666,9 @@ class ScanTab(QWidget):
 
         source_index = self.trades_model.mapToSource(indexes[0])
         row = source_index.row()
-        if row < len(self._trades):
-            trade = self._trades[row]
+        trades = self._filtered_trades or self._trades
+        if row < len(trades):
+            trade = trades[row]
             if trade.edgar_url:
                 webbrowser.open(trade.edgar_url)
             else:
@@ -521,5 +703,7 @@ class ScanTab(QWidget):
         from insider_scanner.core.merger import save_scan_results
 
         ticker = self.ticker_edit.text().strip().upper() or "latest"
-        out = save_scan_results(self._trades, label=f"{ticker}_scan")
+        out = save_scan_results(
+            self._trades, label=f"{ticker}_scan", df=self._all_frame()
+        )
         QMessageBox.information(self, "Saved", f"Results saved to:\n{out}")
@@ -12,6 +12,39 @@ from PySide6.QtCore import (
     QModelIndex,
     QSortFilterProxyModel,
 )
+from PySide6.QtGui import QColor
+
+# Per-cell role values, shared instead of rebuilt on every data() call
+_CONGRESS_FG = QColor(200, 50, 50)
+_RIGHT_ALIGN = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+# Numeric trade columns shown like the scan tab's detail line
+COLUMN_FORMATTERS = {
+    "shares": "{:,.0f}".format,
+    "price": "${:,.2f}".format,
+    "value": "${:,.0f}".format,
+}
+
+
+def _format_cell(val) -> str:
+    if isinstance(val, float):
+        return f"{val:,.2f}"
+    return str(val)
+
+
+def _format_column(col: pd.Series) -> list[str]:
+    """Display strings for one column.
+
+    Numeric columns named in :data:`COLUMN_FORMATTERS` use that format;
+    other floats show as ``1,234.50`` and everything else via ``str()``.
+    """
+    fmt = COLUMN_FORMATTERS.get(col.name)
+    if fmt is not None and col.dtype.kind in "fiu":
+        return [fmt(v) for v in col.to_numpy().tolist()]
+    if col.dtype.kind == "f":
+        return [f"{v:,.2f}" for v in col.to_numpy().tolist()]
+    return [_format_cell(v) for v in col.tolist()]
 
 
 class PandasTableModel(QAbstractTableModel):
@@ -19,36 +52,100 @@ class PandasTableModel(QAbstractTableModel):
 
     def __init__(self, df: pd.DataFrame | None = None, parent=None):
         super().__init__(parent)
-        self._df = df if df is not None else pd.DataFrame()
+        self._df: pd.DataFrame
+        # Appended frames not yet concatenated into _df (see dataframe)
+        self._appended: list[pd.DataFrame] = []
+        self._cells: list[list[str]] = []
+        self._congress: list[bool] | None = None
+        self._nrows = self._ncols = 0
+        self._set(df if df is not None else pd.DataFrame())
 
     def set_dataframe(self, df: pd.DataFrame) -> None:
+        df = df.reset_index(drop=True)
+        old = self.dataframe
+        n = len(old)
+        if (
+            n
+            and len(df) >= n
+            and df.columns.equals(old.columns)
+            and df.iloc[:n].equals(old)
+        ):
+            # Same rows, possibly with more appended: keep the view's
+            # selection and scroll position and announce only new rows.
+            if len(df) > n:
+                self.beginInsertRows(QModelIndex(), n, len(df) - 1)
+                self._set(df, start=n)
+                self.endInsertRows()
+            else:
+                self._df = df
+            return
+
         self.beginResetModel()
-        self._df = df.reset_index(drop=True)
+        self._set(df)
         self.endResetModel()
 
+    def append_dataframe(self, df: pd.DataFrame) -> None:
+        """Add the rows of *df* below the current ones.
+
+        Only the new rows are formatted, and the combined frame is built
+        lazily when :attr:`dataframe` is next read, so streaming many
+        small batches stays linear in the total row count.
+        """
+        if df.empty:
+            return
+        if not self._nrows:
+            self.set_dataframe(df)
+            return
+        if not df.columns.equals(self._df.columns):
+            self.set_dataframe(pd.concat([self.dataframe, df], ignore_index=True))
+            return
+        n = self._nrows
+        self.beginInsertRows(QModelIndex(), n, n + len(df) - 1)
+        self._appended.append(df)
+        self._nrows += len(df)
+        self._format_rows(df)
+        self.endInsertRows()
+
+    def _set(self, df: pd.DataFrame, start: int = 0) -> None:
+        """Adopt *df*, formatting display cells from row *start* on.
+
+        Rows before *start* must be unchanged from the current frame.
+        """
+        tail = df.iloc[start:] if start else df
+        if not start:
+            self._cells = [[] for _ in range(df.shape[1])]
+            self._congress = [] if "is_congress" in df.columns else None
+        self._df = df
+        self._appended = []
+        # Plain ints for rowCount/columnCount, which Qt calls constantly
+        self._nrows, self._ncols = df.shape
+        self._format_rows(tail)
+
+    def _format_rows(self, rows: pd.DataFrame) -> None:
+        # Display strings are formatted once per row, column-major, so
+        # data() is a plain list lookup on every repaint.
+        for c, cells in enumerate(self._cells):
+            cells.extend(_format_column(rows.iloc[:, c]))
+        if self._congress is not None:
+            self._congress.extend(rows["is_congress"].to_numpy(dtype=bool).tolist())
+
     def rowCount(self, parent=QModelIndex()):
-        return len(self._df)
+        return self._nrows
 
     def columnCount(self, parent=QModelIndex()):
-        return len(self._df.columns)
+        return self._ncols
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
         if role == Qt.ItemDataRole.DisplayRole:
-            val = self._df.iloc[index.row(), index.column()]
-            if isinstance(val, float):
-                return f"{val:,.2f}"
-            return str(val)
+            return self._cells[index.column()][index.row()]
         if role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return _RIGHT_ALIGN
         # Highlight congress trades
         if role == Qt.ItemDataRole.ForegroundRole:
-            if "is_congress" in self._df.columns:
-                if self._df.iloc[index.row()]["is_congress"]:
-                    from PySide6.QtGui import QColor
-
-                    return QColor(200, 50, 50)
+            if self._congress is not None and self._congress[index.row()]:
+                return _CONGRESS_FG
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -60,6 +157,9 @@ class PandasTableModel(QAbstractTableModel):
 
     @property
     def dataframe(self):
+        if self._appended:
+            self._df = pd.concat([self._df, *self._appended], ignore_index=True)
+            self._appended = []
         return self._df
 
 
@@ -75,6 +175,9 @@ class SortableTableModel(QSortFilterProxyModel):
     def set_dataframe(self, df: pd.DataFrame):
         self._source.set_dataframe(df)
 
+    def append_dataframe(self, df: pd.DataFrame):
+        self._source.append_dataframe(df)
+
     @property
     def dataframe(self):
         return self._source.dataframe
@@ -118,6 +221,9 @@ class PriceChangeCard(QtWidgets.QFrame):
         lay.addWidget(self.chg_lbl)
         lay.addStretch(1)
 
+        # Last rendered (price text, change text, background)
+        self._shown: Optional[tuple] = None
+
     def set_value(
         self,
         price_usd: Optional[float],
@@ -125,16 +231,24 @@ class PriceChangeCard(QtWidgets.QFrame):
         bg_rgba: Tuple[int, int, int, int] = (40, 40, 40, 120),
     ):
         if price_usd is None:
-            self.price_lbl.setText("n/a")
+            price_text = "n/a"
         else:
-            self.price_lbl.setText(f"{price_usd:,.2f} USD")
+            price_text = f"{price_usd:,.2f} USD"
 
         if pct_change is None:
-            self.chg_lbl.setText("Δ1D: n/a")
+            chg_text = "Δ1D: n/a"
         else:
             sign = "+" if pct_change >= 0 else ""
-            self.chg_lbl.setText(f"Δ1D: {sign}{pct_change:.2f}%")
+            chg_text = f"Δ1D: {sign}{pct_change:.2f}%"
+
+        # Skip labels and the stylesheet re-polish when nothing visible changed
+        shown = (price_text, chg_text, bg_rgba)
+        if shown == self._shown:
+            return
+        self._shown = shown
 
+        self.price_lbl.setText(price_text)
+        self.chg_lbl.setText(chg_text)
         r, g, b, a = bg_rgba
         self.setStyleSheet(
             """
@@ -180,12 +294,21 @@ class ValueCard(QtWidgets.QFrame):
         lay.addWidget(self.meta_lbl)
         lay.addStretch(1)
 
+        # Last rendered (value text, meta text, background)
+        self._shown: Optional[tuple] = None
+
     def set_value(
         self,
         value_text: str,
         meta_text: str = "",
         bg_rgba: Tuple[int, int, int, int] = (40, 40, 40, 120),
     ):
+        # Skip labels and the stylesheet re-polish when nothing visible changed
+        shown = (value_text, meta_text, bg_rgba)
+        if shown == self._shown:
+            return
+        self._shown = shown
+
         self.value_lbl.setText(value_text)
         self.meta_lbl.setText(meta_text)
         r, g, b, a = bg_rgba
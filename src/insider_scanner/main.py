@@ -17,10 +17,12 @@ def main() -> None:
 
     from PySide6.QtWidgets import QApplication
     from insider_scanner.gui.main_window import MainWindow
+    from insider_scanner.utils.threading import configure_thread_pool
 
     app = QApplication(sys.argv)
     app.setApplicationName("Insider Scanner")
     app.setOrganizationName("InsiderScanner")
+    configure_thread_pool()
 
     window = MainWindow()
     window.show()
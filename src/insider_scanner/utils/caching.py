@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import os
+import struct
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 from insider_scanner.utils.config import DEFAULT_CACHE_TTL
@@ -12,49 +15,103 @@ from insider_scanner.utils.logging import get_logger
 
 log = get_logger("caching")
 
+# Each entry is one ``{key}.cache`` file: an 8-byte little-endian float
+# write timestamp followed by the UTF-8 content.  Older releases wrote a
+# ``.txt`` body plus a JSON ``.meta`` file; clear_cache still removes those.
+_HEADER = struct.Struct("<d")
+_SUFFIX = ".cache"
+_LEGACY_SUFFIXES = (".txt", ".meta")
+
+# Process-local LRU over recent reads and writes: (cache_dir, key) →
+# (timestamp, content).  Entries keep the timestamp stored in the file
+# header, so the caller's TTL is applied exactly as for a disk read.
+# Pages can be large, hence the small bound.
+_MEMORY_MAX_ENTRIES = 64
+_memory: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _remember(mkey: tuple[str, str], ts: float, content: str) -> None:
+    with _memory_lock:
+        _memory[mkey] = (ts, content)
+        _memory.move_to_end(mkey)
+        if len(_memory) > _MEMORY_MAX_ENTRIES:
+            _memory.popitem(last=False)
+
 
 def cache_key(url: str) -> str:
-    """Create a filesystem-safe cache key from a URL."""
-    return hashlib.sha256(url.encode()).hexdigest()[:16]
+    """Create a filesystem-safe cache key from a URL.
+
+    A 64-bit BLAKE2b digest gives the 16 hex chars directly, without
+    hashing a full SHA-256 only to truncate it.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
 
 
 def get_cached(cache_dir: Path, key: str, ttl: int = DEFAULT_CACHE_TTL) -> str | None:
     """Return cached content if it exists and hasn't expired, else None."""
-    path = cache_dir / f"{key}.txt"
-    meta_path = cache_dir / f"{key}.meta"
-
-    if not path.exists() or not meta_path.exists():
-        return None
+    mkey = (str(cache_dir), key)
+    with _memory_lock:
+        hit = _memory.get(mkey)
+        if hit is not None:
+            _memory.move_to_end(mkey)
+    if hit is not None and time.time() - hit[0] <= ttl:
+        return hit[1]
 
     try:
-        meta = json.loads(meta_path.read_text())
-        ts = meta.get("timestamp", 0)
-        if time.time() - ts > ttl:
-            log.debug("Cache expired for %s", key)
-            return None
-    except (json.JSONDecodeError, KeyError):
+        with open(cache_dir / f"{key}{_SUFFIX}", "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            (ts,) = _HEADER.unpack(header)
+            if time.time() - ts > ttl:
+                log.debug("Cache expired for %s", key)
+                return None
+            content = f.read().decode("utf-8")
+    except FileNotFoundError:
         return None
 
-    return path.read_text(encoding="utf-8")
+    _remember(mkey, ts, content)
+    return content
 
 
 def set_cached(cache_dir: Path, key: str, content: str) -> None:
     """Write content to cache with current timestamp."""
     cache_dir.mkdir(parents=True, exist_ok=True)
-    path = cache_dir / f"{key}.txt"
-    meta_path = cache_dir / f"{key}.meta"
-
-    path.write_text(content, encoding="utf-8")
-    meta_path.write_text(json.dumps({"timestamp": time.time()}))
+    path = cache_dir / f"{key}{_SUFFIX}"
+    # Scrapers write concurrently: fill a per-thread temp file and swap it
+    # in, so readers never see a half-written entry.
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+
+    ts = time.time()
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(ts))
+        f.write(content.encode("utf-8"))
+    tmp.replace(path)
+    # Write through, so a re-read later in this process skips the disk
+    _remember((str(cache_dir), key), ts, content)
     log.debug("Cached %d chars for %s", len(content), key)
 
 
 def clear_cache(cache_dir: Path) -> int:
     """Remove all cached files. Returns number of files removed."""
     count = 0
-    if cache_dir.exists():
-        for f in cache_dir.iterdir():
-            if f.suffix in (".txt", ".meta"):
-                f.unlink()
-                count += 1
+    prefix = str(cache_dir)
+    with _memory_lock:
+        for mkey in [k for k in _memory if k[0] == prefix]:
+            del _memory[mkey]
+    suffixes = (_SUFFIX, *_LEGACY_SUFFIXES)
+    try:
+        # One scandir pass; no Path object per entry
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # Also temp files an interrupted set_cached left behind
+                if name.endswith(suffixes) or (
+                    name.endswith(".tmp") and f"{_SUFFIX}." in name
+                ):
+                    os.unlink(entry.path)
+                    count += 1
+    except FileNotFoundError:
+        pass
     return count
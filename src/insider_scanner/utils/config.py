@@ -60,12 +60,10 @@ def load_watchlist(path: Path | None = None) -> list[str]:
     and comments (lines starting with #).
     """
     p = path or TICKERS_FILE
-    if not p.exists():
+    try:
+        # Stream lines rather than materialising the text and a split copy
+        with p.open(encoding="utf-8") as fh:
+            stripped = (line.strip() for line in fh)
+            return [t.upper() for t in stripped if t and not t.startswith("#")]
+    except FileNotFoundError:
         return []
-
-    tickers = []
-    for line in p.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if line and not line.startswith("#"):
-            tickers.append(line.upper())
-    return tickers
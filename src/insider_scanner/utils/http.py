@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from insider_scanner.utils.caching import cache_key, get_cached, set_cached
 from insider_scanner.utils.config import SEC_MAX_REQUESTS_PER_SECOND, SEC_USER_AGENT
@@ -13,19 +16,155 @@ from insider_scanner.utils.logging import get_logger
 
 log = get_logger("http")
 
-# Module-level rate limiter
-_last_request_time: float = 0.0
-_min_interval: float = 1.0 / SEC_MAX_REQUESTS_PER_SECOND
+# Transient server errors worth retrying.  429 is not retried: it is
+# cached as a miss instead (see _set_cached_miss).
+_RETRY_STATUSES = (500, 502, 503, 504)
+_STATUS_RETRIES = 2
+_BACKOFF = 0.3
+
+
+def _make_adapter(status_retries: int) -> HTTPAdapter:
+    """Pooled adapter; the pool is sized for the concurrent scraper threads.
+
+    Only one reconnect is attempted and read timeouts are never retried,
+    so a dead host costs a single timeout.  Retry-After is ignored so a
+    server cannot park a worker thread for minutes; the final response
+    is returned as-is so raise_for_status still surfaces failures.
+    """
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=1 + status_retries,
+            connect=1,
+            read=0,
+            other=0,
+            status=status_retries,
+            backoff_factor=_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+
+
+# Shared keep-alive sessions: repeat requests to a host reuse pooled
+# connections instead of paying a TCP/TLS handshake each time.  SEC
+# requests use their own session without status retries, because every
+# attempt must draw from the SEC rate limiter (see _get_sec).
+_session = requests.Session()
+_adapter = _make_adapter(_STATUS_RETRIES)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_sec_session = requests.Session()
+_sec_adapter = _make_adapter(0)
+_sec_session.mount("https://", _sec_adapter)
+_sec_session.mount("http://", _sec_adapter)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing short bursts up to *capacity*.
+
+    Requests spaced further apart than ``1 / rate`` never sleep.  When the
+    budget is exhausted a caller reserves the next token under the lock
+    and sleeps outside it, so concurrent worker threads queue up at the
+    configured rate instead of racing on a shared timestamp.  Uses the
+    monotonic clock so wall-clock adjustments cannot skew the rate.
+    """
+
+    __slots__ = ("capacity", "lock", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until it is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Module-level rate limiter shared by every SEC request.  Capacity 1: no
+# burst, so requests never exceed SEC's per-second ceiling, while calls
+# already spaced 1/rate apart still go out without sleeping.
+_bucket = _TokenBucket(SEC_MAX_REQUESTS_PER_SECOND, 1)
 
 
 def _rate_limit() -> None:
-    """Block until enough time has passed since the last request."""
-    global _last_request_time
-    now = time.time()
-    elapsed = now - _last_request_time
-    if elapsed < _min_interval:
-        time.sleep(_min_interval - elapsed)
-    _last_request_time = time.time()
+    """Block until the SEC request budget allows another request."""
+    _bucket.acquire()
+
+
+# Negative caching: 404s and throttling responses are remembered briefly
+# so repeated lookups (e.g. tickers with no EDGAR filings) fail fast
+# instead of re-hitting the network.  The entry body is
+# "<status> <expires_at>" under a key distinct from the positive entry.
+_NEGATIVE_STATUSES = frozenset({404, 429})
+_RATE_LIMITED_TTL = 300
+_MAX_MISS_TTL = 3600
+
+
+def _miss_key(url: str) -> str:
+    return cache_key(f"miss:{url}")
+
+
+def _raise_for_status(url: str, status: int) -> None:
+    """Raise the same HTTPError a live response with *status* would."""
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    resp.reason = "cached miss"
+    resp.raise_for_status()
+
+
+def _get_cached_miss(cache_dir: Path, url: str) -> int | None:
+    """Return the cached failure status for *url*, if still fresh."""
+    entry = get_cached(cache_dir, _miss_key(url), _MAX_MISS_TTL)
+    if entry is None:
+        return None
+    try:
+        status, expires_at = entry.split()
+        if time.time() < float(expires_at):
+            return int(status)
+    except ValueError:
+        pass
+    return None
+
+
+def _set_cached_miss(
+    cache_dir: Path, url: str, resp: requests.Response, miss_ttl: int
+) -> None:
+    ttl = miss_ttl
+    if resp.status_code == 429:
+        retry_after = resp.headers.get("Retry-After", "")
+        ttl = int(retry_after) if retry_after.isdigit() else _RATE_LIMITED_TTL
+    ttl = min(ttl, _MAX_MISS_TTL)
+    set_cached(cache_dir, _miss_key(url), f"{resp.status_code} {time.time() + ttl}")
+
+
+def _get_sec(url: str, headers: dict, timeout: int) -> requests.Response:
+    """GET an SEC URL, retrying server errors through the rate limiter."""
+    for attempt in range(_STATUS_RETRIES + 1):
+        if attempt:
+            time.sleep(_BACKOFF * 2 ** (attempt - 1))
+        _rate_limit()
+        resp = _sec_session.get(url, headers=headers, timeout=timeout)
+        if resp.status_code not in _RETRY_STATUSES:
+            break
+        log.debug("SEC returned %d for %s", resp.status_code, url)
+    return resp
 
 
 def fetch_url(
@@ -36,6 +175,7 @@ def fetch_url(
     headers: dict | None = None,
     timeout: int = 15,
     use_sec_agent: bool = False,
+    miss_ttl: int = 60,
 ) -> str:
     """Fetch a URL with optional caching and rate limiting.
 
@@ -53,6 +193,9 @@ def fetch_url(
         Request timeout in seconds.
     use_sec_agent : bool
         If True, use SEC-compliant User-Agent and rate limiting.
+    miss_ttl : int
+        Seconds to remember a 404 when caching.  A 429 is remembered for
+        its ``Retry-After`` delay, or five minutes without one.
 
     Returns
     -------
@@ -71,24 +214,28 @@ def fetch_url(
         if cached is not None:
             log.debug("Cache hit for %s", url)
             return cached
+        status = _get_cached_miss(cache_dir, url)
+        if status is not None:
+            log.debug("Cached %d for %s", status, url)
+            _raise_for_status(url, status)
 
     # Build headers
     req_headers = dict(headers or {})
+    log.debug("Fetching %s", url)
     if use_sec_agent:
         req_headers["User-Agent"] = SEC_USER_AGENT
-        _rate_limit()
+        resp = _get_sec(url, req_headers, timeout)
     else:
         if "User-Agent" not in req_headers:
             req_headers["User-Agent"] = "InsiderScanner/0.1"
-
-    log.debug("Fetching %s", url)
-    resp = requests.get(url, headers=req_headers, timeout=timeout)
+        resp = _session.get(url, headers=req_headers, timeout=timeout)
+    if cache_dir is not None and resp.status_code in _NEGATIVE_STATUSES:
+        _set_cached_miss(cache_dir, url, resp, miss_ttl)
     resp.raise_for_status()
     text = resp.text
 
     # Store in cache
     if cache_dir is not None:
-        key = cache_key(url)
         set_cached(cache_dir, key, text)
 
     return text
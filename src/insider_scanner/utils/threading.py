@@ -4,13 +4,36 @@ from __future__ import annotations
 
 import sys
 
-from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+# Upper bound for concurrent background workers.  Each worker may fan out
+# further (watchlist scans), and SEC requests are rate limited anyway, so
+# more threads only add contention on many-core machines.
+MAX_WORKER_THREADS = 8
+
+
+def configure_thread_pool(
+    pool: QThreadPool | None = None, max_threads: int = MAX_WORKER_THREADS
+) -> QThreadPool:
+    """Cap the worker pool (the global instance by default) at *max_threads*.
+
+    All background work goes through ``pool.start(Worker(fn, ...))``, so
+    the cap applies to every tab.  Machines with fewer cores keep Qt's
+    default of one thread per core.
+    """
+    if pool is None:
+        pool = QThreadPool.globalInstance()
+    if pool.maxThreadCount() > max_threads:
+        pool.setMaxThreadCount(max_threads)
+    return pool
 
 
 class WorkerSignals(QObject):
     result = Signal(object)
     error = Signal(tuple)
     finished = Signal()
+    progress = Signal(int)
+    partial = Signal(object)
 
 
 class Worker(QRunnable):
@@ -30,6 +53,25 @@ class Worker(QRunnable):
         self.signals = WorkerSignals()
         self.setAutoDelete(True)
 
+    def reset(self, fn, *args, **kwargs):
+        """Rebind the callable so the same worker can be started again.
+
+        A re-armed worker is owned by its caller, not the thread pool,
+        so auto-deletion is switched off.
+        """
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.setAutoDelete(False)
+
+    def emit_progress(self, value: int):
+        """Report progress from inside the running callable."""
+        self._safe_emit(self.signals.progress, value)
+
+    def emit_partial(self, value):
+        """Hand an intermediate result to the GUI before the final one."""
+        self._safe_emit(self.signals.partial, value)
+
     def _safe_emit(self, signal, *args):
         """Emit a signal, silently ignoring if QObject already deleted."""
         try:
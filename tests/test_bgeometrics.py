@@ -10,6 +10,7 @@ import requests
 from insider_scanner.core.bgeometrics_client import (
     BGeometricsClient,
     INDICATOR_ENDPOINTS,
+    parse_json_latest,
     parse_json_timeseries,
 )
 from insider_scanner.core.dashboard import TTLCache
@@ -98,6 +99,32 @@ class TestParseJsonTimeseries:
         assert rows[0][1] == 0.0
 
 
+class TestParseJsonLatest:
+    def test_returns_last_row(self):
+        data = [
+            {"d": "2026-02-14", "mvrvZscore": "0.4931"},
+            {"d": "2026-02-15", "mvrvZscore": "0.5243"},
+        ]
+        assert parse_json_latest(data, "mvrvZscore") == ("2026-02-15", 0.5243)
+
+    def test_skips_trailing_invalid_records(self):
+        data = [
+            {"d": "2026-02-14", "val": "1,5"},
+            {"d": "2026-02-15", "val": "n/a"},
+            {"d": "2026-02-16"},
+            "junk",
+        ]
+        assert parse_json_latest(data, "val") == ("2026-02-14", 1.5)
+
+    def test_matches_full_parse(self):
+        data = [{"d": f"2026-01-{i:02d}", "v": str(i / 3)} for i in range(1, 29)]
+        assert parse_json_latest(data, "v") == parse_json_timeseries(data, "v")[-1]
+
+    def test_no_valid_rows(self):
+        assert parse_json_latest([], "v") is None
+        assert parse_json_latest({"error": "x"}, "v") is None
+
+
 # -------------------------------------------------------------------
 # BGeometricsClient
 # -------------------------------------------------------------------
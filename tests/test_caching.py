@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import struct
 import time
 
+from insider_scanner.utils import caching
 from insider_scanner.utils.caching import (
     cache_key,
     get_cached,
@@ -13,6 +14,13 @@ from insider_scanner.utils.caching import (
 )
 
 
+def _backdate(path, seconds):
+    """Make a cache entry look as if an earlier process wrote it *seconds* ago."""
+    body = path.read_bytes()[8:]
+    path.write_bytes(struct.pack("<d", time.time() - seconds) + body)
+    caching._memory.pop((str(path.parent), path.stem), None)
+
+
 class TestCacheKey:
     def test_deterministic(self):
         assert cache_key("https://example.com") == cache_key("https://example.com")
@@ -38,8 +46,7 @@ class TestGetSetCached:
     def test_expired(self, tmp_path):
         set_cached(tmp_path, "expkey", "data")
         # Manually set timestamp to the past
-        meta_path = tmp_path / "expkey.meta"
-        meta_path.write_text(json.dumps({"timestamp": time.time() - 7200}))
+        _backdate(tmp_path / "expkey.cache", 7200)
         result = get_cached(tmp_path, "expkey", ttl=3600)
         assert result is None
 
@@ -48,21 +55,75 @@ class TestGetSetCached:
         result = get_cached(tmp_path, "freshkey", ttl=3600)
         assert result == "data"
 
-    def test_corrupted_meta(self, tmp_path):
-        set_cached(tmp_path, "corruptkey", "data")
-        meta_path = tmp_path / "corruptkey.meta"
-        meta_path.write_text("not json")
+    def test_truncated_header(self, tmp_path):
+        (tmp_path / "corruptkey.cache").write_bytes(b"abc")
         result = get_cached(tmp_path, "corruptkey", ttl=3600)
         assert result is None
 
+    def test_single_file_per_entry(self, tmp_path):
+        set_cached(tmp_path, "onekey", "héllo")
+        assert [p.name for p in tmp_path.iterdir()] == ["onekey.cache"]
+        assert get_cached(tmp_path, "onekey", ttl=3600) == "héllo"
+
+
+class TestMemoryLayer:
+    def test_hit_served_from_memory(self, tmp_path):
+        set_cached(tmp_path, "memkey", "data")
+        assert get_cached(tmp_path, "memkey", ttl=3600) == "data"
+        # Second read must not touch the files
+        (tmp_path / "memkey.cache").unlink()
+        assert get_cached(tmp_path, "memkey", ttl=3600) == "data"
+
+    def test_write_populates_memory(self, tmp_path):
+        set_cached(tmp_path, "wkey", "data")
+        (tmp_path / "wkey.cache").unlink()
+        assert get_cached(tmp_path, "wkey", ttl=3600) == "data"
+
+    def test_memory_respects_ttl(self, tmp_path):
+        set_cached(tmp_path, "ttlkey", "data")
+        _backdate(tmp_path / "ttlkey.cache", 100)
+        assert get_cached(tmp_path, "ttlkey", ttl=3600) == "data"
+        assert get_cached(tmp_path, "ttlkey", ttl=50) is None
+
+    def test_set_replaces_memory_entry(self, tmp_path):
+        set_cached(tmp_path, "newkey", "old")
+        assert get_cached(tmp_path, "newkey", ttl=3600) == "old"
+        set_cached(tmp_path, "newkey", "new")
+        assert get_cached(tmp_path, "newkey", ttl=3600) == "new"
+
+    def test_clear_drops_memory_entries(self, tmp_path):
+        set_cached(tmp_path, "clearkey", "data")
+        assert get_cached(tmp_path, "clearkey", ttl=3600) == "data"
+        clear_cache(tmp_path)
+        assert get_cached(tmp_path, "clearkey", ttl=3600) is None
+
 
 class TestClearCache:
     def test_clear(self, tmp_path):
         set_cached(tmp_path, "key1", "a")
         set_cached(tmp_path, "key2", "b")
         count = clear_cache(tmp_path)
-        assert count == 4  # 2 .txt + 2 .meta
+        assert count == 2
+
+    def test_clear_removes_legacy_files(self, tmp_path):
+        (tmp_path / "old.txt").write_text("a")
+        (tmp_path / "old.meta").write_text("{}")
+        assert clear_cache(tmp_path) == 2
+
+    def test_clear_removes_orphaned_temp_files(self, tmp_path):
+        (tmp_path / "key1.cache.12345.tmp").write_bytes(b"partial")
+        assert clear_cache(tmp_path) == 1
+        assert list(tmp_path.iterdir()) == []
 
     def test_clear_empty(self, tmp_path):
         count = clear_cache(tmp_path)
         assert count == 0
+
+    def test_clear_missing_dir(self, tmp_path):
+        assert clear_cache(tmp_path / "absent") == 0
+
+    def test_clear_keeps_other_files(self, tmp_path):
+        set_cached(tmp_path, "key1", "a")
+        (tmp_path / "notes.md").write_text("keep")
+        assert clear_cache(tmp_path) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["notes.md"]
@@ -45,3 +45,9 @@ class TestLoadWatchlist:
         f.write_text("")
         result = load_watchlist(f)
         assert result == []
+
+    def test_crlf_line_endings(self, tmp_path):
+        f = tmp_path / "tickers.txt"
+        f.write_bytes(b"AAPL\r\n# note\r\nMSFT")
+        result = load_watchlist(f)
+        assert result == ["AAPL", "MSFT"]
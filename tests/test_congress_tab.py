@@ -6,12 +6,15 @@ import json
 from datetime import date
 from unittest.mock import patch
 
+import pandas as pd
+
 from insider_scanner.core.models import CongressTrade
 from insider_scanner.gui.congress_tab import (
     DISPLAY_COLUMNS,
     SECTORS,
     _load_congress_names,
     _load_member_sectors,
+    congress_filter_mask,
     congress_trades_to_dataframe,
     filter_congress_trades,
     save_congress_results,
@@ -166,6 +169,25 @@ class TestLoadMemberSectors:
             mapping = _load_member_sectors()
         assert mapping == {}
 
+    def test_reloads_when_file_changes(self, tmp_path):
+        f = tmp_path / "congress_members.json"
+        f.write_text(json.dumps([{"official_name": "Pelosi Nancy"}]))
+        with patch("insider_scanner.utils.config.CONGRESS_FILE", new=f):
+            first = _load_member_sectors()
+            assert _load_member_sectors() is first  # served from cache
+            f.write_text(
+                json.dumps(
+                    [
+                        {"official_name": "Pelosi Nancy"},
+                        {"official_name": "Biggs Andy", "sector": "Energy"},
+                    ]
+                )
+            )
+            mapping = _load_member_sectors()
+            names = _load_congress_names()
+        assert mapping["Biggs Andy"] == ["Energy"]
+        assert names == ["All", "Biggs Andy", "Pelosi Nancy"]
+
 
 # -----------------------------------------------------------------------
 # congress_trades_to_dataframe
@@ -183,6 +205,17 @@ class TestCongressTradesToDataframe:
         df = congress_trades_to_dataframe([])
         assert df.empty
 
+    def test_matches_to_dict_records(self):
+        trades = [*SAMPLE_TRADES, _make_trade(filing_date=None, trade_date=None)]
+        df = congress_trades_to_dataframe(trades)
+        expected = pd.DataFrame([t.to_dict() for t in trades])
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_amounts_are_float64(self):
+        df = congress_trades_to_dataframe([_make_trade(amount_low=1001, amount_high=0)])
+        assert df["amount_low"].dtype == "float64"
+        assert df["amount_high"].dtype == "float64"
+
 
 # -----------------------------------------------------------------------
 # filter_congress_trades
@@ -272,6 +305,56 @@ class TestFilterCongressTrades:
         assert len(result) == 4
 
 
+# -----------------------------------------------------------------------
+# congress_filter_mask
+# -----------------------------------------------------------------------
+
+
+class TestCongressFilterMask:
+    def _masked(self, trades, **kwargs):
+        df = congress_trades_to_dataframe(trades)
+        mask = congress_filter_mask(df, **kwargs)
+        return [t for t, keep in zip(trades, mask) if keep]
+
+    def test_matches_list_filter(self):
+        cases = [
+            {},
+            {"trade_type": "Purchase"},
+            {"min_value": 50000.0},
+            {"since": date(2025, 4, 1)},
+            {"until": date(2025, 3, 15)},
+            {"since": date(2025, 3, 1), "until": date(2025, 4, 30)},
+            {"sector": "Technology", "member_sectors": MEMBER_SECTORS},
+            {"sector": "Defense", "member_sectors": None},
+            {
+                "trade_type": "Purchase",
+                "min_value": 50000.0,
+                "sector": "Technology",
+                "member_sectors": MEMBER_SECTORS,
+            },
+        ]
+        for kwargs in cases:
+            expected = filter_congress_trades(SAMPLE_TRADES, **kwargs)
+            assert self._masked(SAMPLE_TRADES, **kwargs) == expected, kwargs
+
+    def test_missing_filing_date_excluded_by_range(self):
+        trades = [*SAMPLE_TRADES, _make_trade(filing_date=None)]
+        assert len(self._masked(trades, until=date(2030, 1, 1))) == 4
+        assert len(self._masked(trades, since=date(2000, 1, 1))) == 4
+
+    def test_unmapped_official_counts_as_other(self):
+        trades = [*SAMPLE_TRADES, _make_trade(official_name="Nobody Known")]
+        result = self._masked(trades, sector="Other", member_sectors=MEMBER_SECTORS)
+        assert result == filter_congress_trades(
+            trades, sector="Other", member_sectors=MEMBER_SECTORS
+        )
+        assert {t.official_name for t in result} == {"Biggs Andy", "Nobody Known"}
+
+    def test_empty_frame(self):
+        df = congress_trades_to_dataframe([])
+        assert len(congress_filter_mask(df, trade_type="Sale")) == 0
+
+
 # -----------------------------------------------------------------------
 # save_congress_results
 # -----------------------------------------------------------------------
@@ -298,6 +381,24 @@ class TestSaveCongressResults:
         assert len(data) == 2
         assert data[0]["ticker"] == "AAPL"
 
+    def test_csv_matches_json(self, tmp_path):
+        with (
+            patch(
+                "insider_scanner.utils.config.SCAN_OUTPUTS_DIR",
+                new=tmp_path,
+            ),
+            patch(
+                "insider_scanner.utils.config.ensure_dirs",
+            ),
+        ):
+            save_congress_results(SAMPLE_TRADES, label="both")
+
+        df = pd.read_csv(tmp_path / "both.csv", keep_default_na=False)
+        data = json.loads((tmp_path / "both.json").read_text())
+        assert list(df.columns) == list(data[0])
+        assert df["ticker"].tolist() == [d["ticker"] for d in data]
+        assert df["filing_date"].tolist() == [d["filing_date"] for d in data]
+
     def test_saves_empty(self, tmp_path):
         with (
             patch(
@@ -311,6 +412,25 @@ class TestSaveCongressResults:
             save_congress_results([], label="empty_scan")
 
         assert (tmp_path / "empty_scan.csv").exists()
+        assert json.loads((tmp_path / "empty_scan.json").read_text()) == []
+
+    def test_json_one_record_per_line(self, tmp_path):
+        with (
+            patch(
+                "insider_scanner.utils.config.SCAN_OUTPUTS_DIR",
+                new=tmp_path,
+            ),
+            patch(
+                "insider_scanner.utils.config.ensure_dirs",
+            ),
+        ):
+            save_congress_results(SAMPLE_TRADES, label="lines")
+
+        text = (tmp_path / "lines.json").read_text()
+        lines = text.splitlines()
+        assert lines[0] == "[" and lines[-1] == "]"
+        assert len(lines) == len(SAMPLE_TRADES) + 2
+        assert json.loads(text) == [t.to_dict() for t in SAMPLE_TRADES]
 
 
 # -----------------------------------------------------------------------
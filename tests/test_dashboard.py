@@ -113,6 +113,18 @@ class TestExtractClose:
         assert len(s) == 2
         assert s.iloc[0] == 15.0
 
+    def test_multiindex_missing_symbol_is_empty(self):
+        idx = pd.to_datetime(["2025-01-01"])
+        cols = pd.MultiIndex.from_tuples([("Close", "SPY"), ("Close", "QQQ")])
+        df = pd.DataFrame([[500.0, 400.0]], index=idx, columns=cols)
+        assert _extract_close(df, "GLD").empty
+
+    def test_multiindex_single_ticker_fallback(self):
+        idx = pd.to_datetime(["2025-01-01"])
+        cols = pd.MultiIndex.from_tuples([("Close", "VIX")])
+        df = pd.DataFrame([[15.0]], index=idx, columns=cols)
+        assert _extract_close(df, "^VIX").iloc[0] == 15.0
+
     def test_empty_dataframe(self):
         assert _extract_close(pd.DataFrame(), "X").empty
 
@@ -451,6 +463,39 @@ class TestMarketProvider:
             s = provider.get_daily_close("FAKE", 5)
         assert s.empty
 
+    def test_get_daily_closes_single_download(self):
+        provider = MarketProvider()
+        idx = pd.date_range("2025-01-01", periods=10, freq="D")
+        cols = pd.MultiIndex.from_tuples([("Close", "AAA"), ("Close", "BBB")])
+        fake_df = pd.DataFrame(
+            [[1.0 + i, 100.0 + i] for i in range(10)], index=idx, columns=cols
+        )
+
+        with patch(
+            "insider_scanner.core.dashboard.yf.download", return_value=fake_df
+        ) as mock_dl:
+            closes = provider.get_daily_closes(["AAA", "BBB"], 5)
+            again = provider.get_daily_closes(["AAA", "BBB"], 5)
+            single = provider.get_daily_close("BBB", 5)
+        mock_dl.assert_called_once()
+        assert mock_dl.call_args.args[0] == ["AAA", "BBB"]
+        assert closes["AAA"].tolist() == [6.0, 7.0, 8.0, 9.0, 10.0]
+        assert closes["BBB"].iloc[-1] == 109.0
+        assert again["AAA"] is closes["AAA"]
+        assert single is closes["BBB"]
+
+    def test_get_daily_closes_downloads_only_missing(self):
+        provider = MarketProvider()
+        fake_df = self._make_df(10)
+
+        with patch(
+            "insider_scanner.core.dashboard.yf.download", return_value=fake_df
+        ) as mock_dl:
+            provider.get_daily_close("AAA", 5)
+            provider.get_daily_closes(["AAA", "BBB"], 5)
+        assert mock_dl.call_count == 2
+        assert mock_dl.call_args.args[0] == ["BBB"]
+
     def test_get_vix_daily(self):
         provider = MarketProvider()
         fake_df = self._make_df(50)
@@ -538,6 +583,65 @@ class TestMarketProvider:
         assert snap.fear_greed.get("gold") == (55, "Greed")
         assert "rsi" in snap.indicators
 
+    def test_fetch_all_falls_back_per_symbol(self):
+        """A failed batch download is retried one symbol at a time."""
+        provider = MarketProvider()
+        good = self._make_df(30)
+
+        def download(symbols, **kwargs):
+            if symbols == list(PRICE_SYMBOLS):
+                raise RuntimeError("batch failed")
+            if symbols == PRICE_SYMBOLS[0]:
+                raise RuntimeError("bad symbol")
+            return good
+
+        with (
+            patch("insider_scanner.core.dashboard.yf.download", side_effect=download),
+            patch.object(provider, "get_fear_greed", return_value={}),
+            patch.object(provider._cbbi, "get_latest", return_value=None),
+            patch.object(provider._bgeometrics, "get_all_latest", return_value={}),
+        ):
+            snap = provider.fetch_all()
+
+        assert snap.prices[PRICE_SYMBOLS[0]].empty
+        assert all(not snap.prices[s].empty for s in PRICE_SYMBOLS[1:])
+
+    def test_fetch_all_http_sources_off_calling_thread(self):
+        """HTTP-only sources run on the pool; yfinance stays on the caller."""
+        import threading
+
+        provider = MarketProvider()
+        caller = threading.get_ident()
+        seen = {}
+
+        def record(name, value):
+            def fn(*args, **kwargs):
+                seen[name] = threading.get_ident()
+                return value
+
+            return fn
+
+        with patch(
+            "insider_scanner.core.dashboard.yf.download",
+            side_effect=record("yf", self._make_df(30)),
+        ):
+            with patch.object(provider, "get_fear_greed", record("fg", {})):
+                with patch.object(provider._cbbi, "get_latest", record("cbbi", 42.0)):
+                    with patch.object(
+                        provider._bgeometrics,
+                        "get_all_latest",
+                        record("bg", {"nupl": 0.3}),
+                    ):
+                        snap = provider.fetch_all()
+
+        assert seen["yf"] == caller
+        assert seen["fg"] != caller
+        assert seen["cbbi"] != caller
+        assert seen["bg"] != caller
+        assert snap.indicators["cbbi"] == 42.0
+        assert snap.indicators["nupl"] == 0.3
+        assert "rsi" in snap.indicators
+
     def test_fetch_all_survives_failures(self):
         """fetch_all() returns partial data even when some calls fail."""
         provider = MarketProvider()
@@ -153,3 +153,16 @@ class TestBuildEdgarUrl:
         url = build_edgar_url_for_trade(trade)
         assert "Test+Person" in url
         assert "AAPL" in url
+
+    def test_build_url_reused_for_duplicate_trades(self):
+        from datetime import date
+
+        a = InsiderTrade(
+            ticker="AAPL", insider_name="Cook Timothy", filing_date=date(2025, 11, 15)
+        )
+        b = InsiderTrade(
+            ticker="AAPL", insider_name="Cook Timothy", filing_date=date(2025, 11, 15)
+        )
+        url = build_edgar_url_for_trade(a)
+        assert build_edgar_url_for_trade(b) is url
+        assert "startdt=2025-11-01&enddt=2025-11-15" in url
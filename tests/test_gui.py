@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pandas as pd
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
 
 
 class TestPandasTableModel:
@@ -25,6 +26,60 @@ class TestPandasTableModel:
         idx = model.index(0, 0)
         assert model.data(idx) == "1,234,567.89"
 
+    def test_preformatted_cells_match_values(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        df = pd.DataFrame(
+            {
+                "ticker": ["AAPL", "MSFT"],
+                "count": [100, 2500],
+                "ratio": [1.5, float("nan")],
+                "mixed": [3.25, "n/a"],
+                "is_congress": [False, True],
+            }
+        )
+        model = PandasTableModel()
+        model.set_dataframe(df)
+        for r in range(len(df)):
+            for c in range(len(df.columns)):
+                val = df.iloc[r, c]
+                expected = f"{val:,.2f}" if isinstance(val, float) else str(val)
+                assert model.data(model.index(r, c)) == expected
+        fg = Qt.ItemDataRole.ForegroundRole
+        assert model.data(model.index(0, 0), fg) is None
+        assert model.data(model.index(1, 0), fg) == QColor(200, 50, 50)
+
+    def test_trade_columns_use_detail_formats(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        df = pd.DataFrame({"shares": [12500.0], "price": [185.5], "value": [2318750.0]})
+        model = PandasTableModel()
+        model.set_dataframe(df)
+        cells = [model.data(model.index(0, c)) for c in range(3)]
+        assert cells == ["12,500", "$185.50", "$2,318,750"]
+
+    def test_append_inserts_rows_without_reset(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        model = PandasTableModel()
+        df = pd.DataFrame({"ticker": ["AAPL"], "ratio": [1000.0]})
+        model.set_dataframe(df)
+        resets, inserts = [], []
+        model.modelReset.connect(lambda: resets.append(1))
+        model.rowsInserted.connect(lambda _p, a, b: inserts.append((a, b)))
+
+        model.set_dataframe(df.copy())
+        longer = pd.DataFrame({"ticker": ["AAPL", "MSFT"], "ratio": [1000.0, 5.0]})
+        model.set_dataframe(longer)
+        assert resets == []
+        assert inserts == [(1, 1)]
+        assert model.rowCount() == 2
+        assert model.data(model.index(1, 1)) == "5.00"
+
+        model.set_dataframe(longer.iloc[1:])
+        assert resets == [1]
+        assert model.data(model.index(0, 0)) == "MSFT"
+
     def test_empty(self, qtbot):
         from insider_scanner.gui.widgets import PandasTableModel
 
@@ -32,6 +87,34 @@ class TestPandasTableModel:
         assert model.rowCount() == 0
 
 
+class TestAppendDataframe:
+    def test_append_formats_only_new_rows(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        model = PandasTableModel(pd.DataFrame({"ratio": [1.5]}))
+        model.append_dataframe(pd.DataFrame({"ratio": [2.25, 3.0]}))
+        assert model.rowCount() == 3
+        assert model.data(model.index(2, 0)) == "3.00"
+        assert model.dataframe["ratio"].tolist() == [1.5, 2.25, 3.0]
+        assert model.dataframe.index.tolist() == [0, 1, 2]
+
+    def test_append_to_empty_model(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        model = PandasTableModel()
+        model.append_dataframe(pd.DataFrame({"count": ["a"]}))
+        assert model.rowCount() == 1
+        assert model.columnCount() == 1
+
+    def test_append_different_columns_resets(self, qtbot):
+        from insider_scanner.gui.widgets import PandasTableModel
+
+        model = PandasTableModel(pd.DataFrame({"a": ["x"]}))
+        model.append_dataframe(pd.DataFrame({"b": ["y"]}))
+        assert model.rowCount() == 2
+        assert model.columnCount() == 2
+
+
 class TestSortableTableModel:
     def test_set_and_sort(self, qtbot):
         from insider_scanner.gui.widgets import SortableTableModel
@@ -44,6 +127,89 @@ class TestSortableTableModel:
         assert model.rowCount() == 3
 
 
+class TestDashboardCards:
+    def test_price_card_skips_unchanged_render(self, qtbot, monkeypatch):
+        from insider_scanner.gui.widgets import PriceChangeCard
+
+        card = PriceChangeCard("BTC")
+        qtbot.addWidget(card)
+        card.set_value(100.0, 1.5, (1, 2, 3, 4))
+        calls = []
+        monkeypatch.setattr(card, "setStyleSheet", calls.append)
+        card.set_value(100.001, 1.501, (1, 2, 3, 4))
+        assert calls == []
+        card.set_value(101.0, 1.5, (1, 2, 3, 4))
+        assert len(calls) == 1
+        assert card.price_lbl.text() == "101.00 USD"
+
+    def test_value_card_skips_unchanged_render(self, qtbot, monkeypatch):
+        from insider_scanner.gui.widgets import ValueCard
+
+        card = ValueCard("RSI")
+        qtbot.addWidget(card)
+        card.set_value("50", "", (1, 2, 3, 4))
+        calls = []
+        monkeypatch.setattr(card, "setStyleSheet", calls.append)
+        card.set_value("50", "", (1, 2, 3, 4))
+        assert calls == []
+        card.set_value("n/a", "data unavailable", (1, 2, 3, 4))
+        assert len(calls) == 1
+
+
+class TestTradeFilterMask:
+    def _trades(self):
+        from datetime import date
+
+        from insider_scanner.core.models import InsiderTrade
+
+        return [
+            InsiderTrade(
+                "AAPL", trade_type="Buy", value=50_000.0, filing_date=date(2025, 1, 10)
+            ),
+            InsiderTrade(
+                "MSFT",
+                trade_type="Sell",
+                value=-250_000.0,
+                filing_date=date(2025, 3, 5),
+                is_congress=True,
+            ),
+            InsiderTrade("NVDA", trade_type="Buy", value=1_000.0),
+        ]
+
+    def test_matches_list_filter(self):
+        from datetime import date
+
+        from insider_scanner.core.merger import filter_trades, trades_to_dataframe
+        from insider_scanner.gui.scan_tab import trade_filter_mask
+
+        trades = self._trades()
+        df = trades_to_dataframe(trades)
+        cases = [
+            {},
+            {"trade_type": "Buy"},
+            {"min_value": 100_000.0},
+            {"congress_only": True},
+            {"since": date(2025, 2, 1)},
+            {"until": date(2025, 2, 1)},
+            {"trade_type": "Buy", "since": date(2024, 1, 1)},
+        ]
+        for kwargs in cases:
+            mask = trade_filter_mask(df, **kwargs)
+            masked = [t for t, keep in zip(trades, mask) if keep]
+            assert masked == filter_trades(trades, **kwargs), kwargs
+
+    def test_apply_filters_keeps_rows_aligned(self, qtbot):
+        from insider_scanner.gui.scan_tab import ScanTab
+
+        tab = ScanTab()
+        qtbot.addWidget(tab)
+        tab._on_scan_done(self._trades())
+        tab.chk_congress.setChecked(True)
+        tab._apply_filters()
+        assert tab.trades_model.rowCount() == 1
+        assert [t.ticker for t in tab._filtered_trades] == ["MSFT"]
+
+
 class TestScanTab:
     def test_create(self, qtbot):
         from insider_scanner.gui.scan_tab import ScanTab
@@ -129,6 +295,21 @@ class TestScanTab:
         tab.latest_count_spin.setValue(250)
         assert tab.latest_count_spin.value() == 250
 
+    def test_columns_fitted_once_per_load(self, qtbot):
+        from PySide6.QtWidgets import QHeaderView
+
+        from insider_scanner.core.models import InsiderTrade
+        from insider_scanner.gui.scan_tab import ScanTab
+
+        tab = ScanTab()
+        qtbot.addWidget(tab)
+        name = "A Very Long Insider Name That Needs Room"
+        tab._on_scan_done([InsiderTrade("AAPL", insider_name=name)])
+        header = tab.trades_table.horizontalHeader()
+        col = list(tab.trades_model.dataframe.columns).index("insider_name")
+        assert header.sectionResizeMode(col) == QHeaderView.ResizeMode.Interactive
+        assert header.sectionSize(col) > header.defaultSectionSize()
+
     def test_watchlist_button_exists(self, qtbot):
         from insider_scanner.gui.scan_tab import ScanTab
 
@@ -153,6 +334,88 @@ class TestScanTab:
         assert tab.btn_watchlist.isEnabled()
         assert tab.btn_stop.isHidden()  # stop hidden when idle
 
+    def test_scrape_watchlist_runs_sources_concurrently(self):
+        import threading
+
+        from insider_scanner.gui.scan_tab import _scrape_watchlist
+
+        # Each fake source waits for the other: a serial scan would break it
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_sf4(ticker, **kwargs):
+            barrier.wait()
+            return [f"sf4-{ticker}"]
+
+        def fake_oi(ticker, **kwargs):
+            barrier.wait()
+            return [f"oi-{ticker}"]
+
+        progress, streamed = [], []
+        lists = _scrape_watchlist(
+            ["AAPL", "MSFT"],
+            [(fake_sf4, 1), (fake_oi, 1)],
+            on_progress=progress.append,
+            on_ticker=streamed.append,
+        )
+        assert lists == [["sf4-AAPL"], ["oi-AAPL"], ["sf4-MSFT"], ["oi-MSFT"]]
+        assert progress == [1, 2]
+        assert streamed == [[["sf4-AAPL"], ["oi-AAPL"]], [["sf4-MSFT"], ["oi-MSFT"]]]
+
+    def test_scrape_watchlist_caps_workers_per_source(self):
+        import threading
+
+        from insider_scanner.gui.scan_tab import _scrape_watchlist
+
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def fake(ticker, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            return [ticker]
+
+        lists = _scrape_watchlist(["A", "B", "C", "D"], [(fake, 1)])
+        assert lists == [["A"], ["B"], ["C"], ["D"]]
+        assert peak[0] == 1
+
+    def test_streamed_trades_append_rows(self, qtbot):
+        from insider_scanner.core.models import InsiderTrade
+        from insider_scanner.gui.scan_tab import ScanTab
+
+        tab = ScanTab()
+        qtbot.addWidget(tab)
+        resets, inserts = [], []
+        source = tab.trades_model.sourceModel()
+        source.modelReset.connect(lambda: resets.append(1))
+        source.rowsInserted.connect(lambda *args: inserts.append(args[1:]))
+        for trade in (
+            InsiderTrade("AAPL", insider_name="A"),
+            InsiderTrade("MSFT", insider_name="B"),
+            InsiderTrade("NVDA", insider_name="C"),
+        ):
+            tab._append_trades(([trade], ScanTab._trades_frame([trade])))
+        assert tab.trades_model.rowCount() == 3
+        assert [t.ticker for t in tab._trades] == ["AAPL", "MSFT", "NVDA"]
+        assert resets == [1]  # only the first batch replaced the empty table
+        assert inserts == [(1, 1), (2, 2)]
+        assert source.dataframe["ticker"].tolist() == ["AAPL", "MSFT", "NVDA"]
+        assert tab._all_frame()["ticker"].tolist() == ["AAPL", "MSFT", "NVDA"]
+        assert tab.status_label.text().startswith("3 trades found")
+
+    def test_scrape_watchlist_cancelled(self):
+        from threading import Event
+
+        from insider_scanner.gui.scan_tab import _scrape_watchlist
+
+        cancel = Event()
+        cancel.set()
+        lists = _scrape_watchlist(["AAPL"], [(lambda t, **kw: ["x"], 1)], cancel=cancel)
+        assert lists == [[]]
+
     def test_stop_button_exists(self, qtbot):
         from insider_scanner.gui.scan_tab import ScanTab
 
@@ -198,6 +461,204 @@ class TestMainWindow:
         assert win.status_bar.currentMessage() == "Testing"
 
 
+class TestThreadPool:
+    def test_caps_large_pool(self, qtbot):
+        from PySide6.QtCore import QThreadPool
+
+        from insider_scanner.utils.threading import configure_thread_pool
+
+        pool = QThreadPool()
+        pool.setMaxThreadCount(32)
+        assert configure_thread_pool(pool, max_threads=8) is pool
+        assert pool.maxThreadCount() == 8
+
+    def test_keeps_smaller_pool(self, qtbot):
+        from PySide6.QtCore import QThreadPool
+
+        from insider_scanner.utils.threading import configure_thread_pool
+
+        pool = QThreadPool()
+        pool.setMaxThreadCount(2)
+        configure_thread_pool(pool, max_threads=8)
+        assert pool.maxThreadCount() == 2
+
+
+class _StubProvider:
+    def __init__(self):
+        self.latest_indicator_values = {}
+
+    def fetch_all(self):
+        from insider_scanner.core.dashboard import DashboardSnapshot
+
+        return DashboardSnapshot()
+
+
+class TestDashboardTab:
+    def _make_tab(self, qtbot):
+        from insider_scanner.gui.dashboard_tab import DashboardTab
+
+        tab = DashboardTab(_StubProvider(), [])
+        qtbot.addWidget(tab)
+        return tab
+
+    def test_missing_price_and_indicator_values(self, qtbot):
+        from insider_scanner.core.dashboard import (
+            PRICE_SYMBOLS,
+            DashboardSnapshot,
+            IndicatorSpec,
+        )
+        from insider_scanner.gui.dashboard_tab import DashboardTab
+
+        specs = [IndicatorSpec("rsi", "RSI"), IndicatorSpec("cbbi", "CBBI", unit="%")]
+        tab = DashboardTab(_StubProvider(), specs)
+        qtbot.addWidget(tab)
+        tab._on_snapshot(DashboardSnapshot(indicators={"cbbi": 42.0}))
+        assert tab.top_cards[PRICE_SYMBOLS[0]].price_lbl.text() == "n/a"
+        assert tab.ind_cards["rsi"].value_lbl.text() == "n/a"
+        assert tab.ind_cards["cbbi"].value_lbl.text() == "42.0 %"
+
+    def test_price_change_from_last_two_closes(self, qtbot):
+        import pandas as pd
+
+        from insider_scanner.core.dashboard import PRICE_SYMBOLS, DashboardSnapshot
+
+        tab = self._make_tab(qtbot)
+        symbol = PRICE_SYMBOLS[0]
+        prices = {symbol: pd.Series([90.0, 100.0, 110.0])}
+        tab._on_snapshot(DashboardSnapshot(prices=prices))
+        card = tab.top_cards[symbol]
+        assert card.price_lbl.text() == "110.00 USD"
+        assert "+10.00%" in card.chg_lbl.text()
+
+    def test_refresh_reuses_single_worker(self, qtbot, monkeypatch):
+        from insider_scanner.gui import dashboard_tab
+
+        started = []
+
+        class _Pool:
+            def start(self, runnable):
+                started.append(runnable)
+
+        monkeypatch.setattr(
+            dashboard_tab.QThreadPool, "globalInstance", staticmethod(_Pool)
+        )
+        tab = self._make_tab(qtbot)
+        tab.refresh_async()
+        tab._on_finished()
+        tab.refresh_async()
+        assert len(started) == 2
+        assert started[0] is started[1] is tab._worker
+        assert not tab._worker.autoDelete()
+
+    def test_timer_rearmed_after_refresh_finishes(self, qtbot, monkeypatch):
+        from insider_scanner.gui import dashboard_tab
+
+        class _Pool:
+            def start(self, runnable):
+                pass
+
+        monkeypatch.setattr(
+            dashboard_tab.QThreadPool, "globalInstance", staticmethod(_Pool)
+        )
+        tab = self._make_tab(qtbot)
+        assert tab._timer.isSingleShot()
+        tab.refresh_async()
+        assert not tab._timer.isActive()
+        tab._on_finished()
+        assert tab._timer.isActive()
+
+    def test_vix_empty_curve_not_cleared_twice(self, qtbot, monkeypatch):
+        import pandas as pd
+
+        from insider_scanner.core.dashboard import DashboardSnapshot
+
+        tab = self._make_tab(qtbot)
+        vix = pd.Series(
+            [15.0, 16.0], index=pd.date_range("2024-01-01", periods=2, tz="UTC")
+        )
+        tab._on_snapshot(DashboardSnapshot(vix=vix))
+        calls = []
+        monkeypatch.setattr(tab.vix_curve, "setData", lambda *a: calls.append(a))
+        tab._on_error((RuntimeError, RuntimeError("x"), None))
+        tab._on_snapshot(DashboardSnapshot(vix=pd.Series(dtype=float)))
+        assert calls == [([], [])]
+
+    def test_error_marks_cards_unavailable(self, qtbot):
+        tab = self._make_tab(qtbot)
+        tab._on_error((RuntimeError, RuntimeError("offline"), None))
+        assert tab.updatesEnabled()
+        assert tab.fg_cards["gold"].value_lbl.text() == "n/a"
+        assert all(c.price_lbl.text() == "n/a" for c in tab.top_cards.values())
+
+    def test_unchanged_snapshot_sections_skipped(self, qtbot, monkeypatch):
+        from insider_scanner.core.dashboard import PRICE_SYMBOLS, DashboardSnapshot
+
+        tab = self._make_tab(qtbot)
+        calls = []
+        card = tab.top_cards[PRICE_SYMBOLS[0]]
+        monkeypatch.setattr(card, "set_value", lambda *a: calls.append(("p", a)))
+        fg_card = tab.fg_cards["stocks"]
+        monkeypatch.setattr(fg_card, "set_value", lambda *a: calls.append(("f", a)))
+
+        prices = {PRICE_SYMBOLS[0]: pd.Series([100.0, 101.0])}
+        snap = DashboardSnapshot(prices=prices, fear_greed={"stocks": (50, "Neutral")})
+        tab._on_snapshot(snap)
+        assert [k for k, _ in calls] == ["p", "f"]
+
+        # Same cached objects / equal values: nothing is re-applied
+        tab._on_snapshot(
+            DashboardSnapshot(
+                prices=dict(prices), fear_greed={"stocks": (50, "Neutral")}
+            )
+        )
+        assert len(calls) == 2
+
+        # A new price series object is applied again
+        tab._on_snapshot(
+            DashboardSnapshot(
+                prices={PRICE_SYMBOLS[0]: pd.Series([100.0, 99.0])},
+                fear_greed={"stocks": (50, "Neutral")},
+            )
+        )
+        assert [k for k, _ in calls] == ["p", "f", "p"]
+
+    def test_vix_x_is_posix_seconds(self, qtbot):
+        tab = self._make_tab(qtbot)
+        idx = pd.to_datetime(["2025-01-01", "2025-01-02"], utc=True)
+        tab._apply_vix(pd.Series([15.0, 16.0], index=idx))
+        x, y = tab.vix_curve.getData()
+        assert list(x) == [1735689600.0, 1735776000.0]
+        assert list(y) == [15.0, 16.0]
+
+    def test_vix_autorange_only_when_extent_changes(self, qtbot, monkeypatch):
+        tab = self._make_tab(qtbot)
+        calls = []
+        vb = tab.vix_plot.getPlotItem().vb
+        monkeypatch.setattr(vb, "setRange", lambda **kw: calls.append(kw))
+        idx = pd.date_range("2025-01-01", periods=3, freq="D", tz="UTC")
+
+        tab._apply_vix(pd.Series([15.0, 16.0, 17.0], index=idx))
+        tab._apply_vix(pd.Series([15.0, 16.0, 17.0], index=idx))
+        assert len(calls) == 1
+        tab._apply_vix(pd.Series([15.0, 16.0, 21.0], index=idx))
+        assert len(calls) == 2
+        assert calls[-1]["yRange"] == (15.0, 21.0)
+        assert calls[-1]["xRange"] == (1735689600.0, 1735862400.0)
+
+    def test_vix_same_cached_series_skips_set_data(self, qtbot, monkeypatch):
+        tab = self._make_tab(qtbot)
+        calls = []
+        monkeypatch.setattr(tab.vix_curve, "setData", lambda *a: calls.append(a))
+        idx = pd.date_range("2025-01-01", periods=3, freq="D", tz="UTC")
+        s = pd.Series([15.0, 16.0, 17.0], index=idx)
+
+        tab._apply_vix(s)
+        tab._apply_vix(s)
+        assert len(calls) == 1
+        tab._apply_vix(s.copy())
+        assert len(calls) == 2
+
+
 class TestCongressTab:
     def test_create(self, qtbot):
         from insider_scanner.gui.congress_tab import CongressTab
@@ -285,3 +746,98 @@ class TestCongressTab:
         qtbot.addWidget(tab)
         tab._display_trades([])
         assert "No trades" in tab.status_label.text()
+
+    def test_apply_filters_masks_cached_frame(self, qtbot):
+        from datetime import date
+
+        from insider_scanner.core.models import CongressTrade
+        from insider_scanner.gui.congress_tab import DISPLAY_COLUMNS, CongressTab
+
+        trades = [
+            CongressTrade(
+                official_name="A",
+                ticker="AAPL",
+                trade_type="Purchase",
+                filing_date=date(2025, 1, 2),
+            ),
+            CongressTrade(
+                official_name="B",
+                ticker="MSFT",
+                trade_type="Sale",
+                filing_date=date(2025, 1, 3),
+            ),
+            CongressTrade(
+                official_name="C",
+                ticker="NVDA",
+                trade_type="Purchase",
+                filing_date=date(2025, 1, 4),
+            ),
+        ]
+        tab = CongressTab()
+        qtbot.addWidget(tab)
+        tab._on_scan_done(trades)
+        assert tab.trades_model.rowCount() == 3
+
+        tab.type_combo.setCurrentText("Purchase")
+        tab._apply_filters()
+        df = tab.trades_model.dataframe
+        assert list(df.columns) == DISPLAY_COLUMNS
+        assert df["ticker"].tolist() == ["AAPL", "NVDA"]
+        assert tab._filtered_trades == [trades[0], trades[2]]
+
+    def test_scan_runs_house_and_senate_concurrently(self, qtbot, monkeypatch):
+        import threading
+
+        from insider_scanner.core.models import CongressTrade
+        from insider_scanner.gui import congress_tab
+        from insider_scanner.gui.congress_tab import CongressTab
+
+        # Each fake scraper waits for the other: a serial scan would break it
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_house(**kwargs):
+            barrier.wait()
+            return [CongressTrade(official_name="H", source="house")]
+
+        def fake_senate(**kwargs):
+            barrier.wait()
+            return [CongressTrade(official_name="S", source="senate")]
+
+        monkeypatch.setattr(congress_tab, "scrape_house_trades", fake_house)
+        monkeypatch.setattr(congress_tab, "scrape_senate_trades", fake_senate)
+
+        tab = CongressTab()
+        qtbot.addWidget(tab)
+        tab._run_scan()
+        qtbot.waitUntil(lambda: tab.btn_scan.isEnabled(), timeout=10_000)
+        assert [t.source for t in tab._trades] == ["house", "senate"]
+
+    def test_refresh_member_list(self, qtbot, tmp_path):
+        import json
+        import os
+        from unittest.mock import patch
+
+        from insider_scanner.gui.congress_tab import CongressTab
+
+        f = tmp_path / "congress_members.json"
+        f.write_text(json.dumps([{"official_name": "Biggs Andy"}]))
+        with patch("insider_scanner.utils.config.CONGRESS_FILE", new=f):
+            tab = CongressTab()
+            qtbot.addWidget(tab)
+            tab.official_combo.setCurrentText("Biggs Andy")
+
+            # Unchanged file: combo left alone
+            tab._refresh_member_list()
+            assert tab.official_combo.count() == 2
+            assert tab.official_combo.currentText() == "Biggs Andy"
+
+            f.write_text(json.dumps([{"name": "Adams Alma"}, {"name": "Biggs Andy"}]))
+            st = f.stat()
+            os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            tab._refresh_member_list()
+            items = [
+                tab.official_combo.itemText(i)
+                for i in range(tab.official_combo.count())
+            ]
+            assert items == ["All", "Adams Alma", "Biggs Andy"]
+            assert tab.official_combo.currentText() == "Biggs Andy"
@@ -0,0 +1,163 @@
+"""Tests for the HTTP client (mocked responses)."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+import responses
+
+from insider_scanner.utils import http
+from insider_scanner.utils.http import fetch_url
+
+
+class TestFetchUrl:
+    @responses.activate
+    def test_fetch_text(self):
+        responses.add(responses.GET, "https://example.com/a", body="hello")
+        assert fetch_url("https://example.com/a") == "hello"
+
+    @responses.activate
+    def test_default_user_agent(self):
+        responses.add(responses.GET, "https://example.com/a", body="x")
+        fetch_url("https://example.com/a")
+        assert responses.calls[0].request.headers["User-Agent"] == "InsiderScanner/0.1"
+
+    @responses.activate
+    def test_http_error_raises(self):
+        responses.add(responses.GET, "https://example.com/missing", status=404)
+        with pytest.raises(requests.HTTPError):
+            fetch_url("https://example.com/missing")
+
+    @responses.activate
+    def test_cached_response_skips_network(self, tmp_path):
+        responses.add(responses.GET, "https://example.com/c", body="cached")
+        assert fetch_url("https://example.com/c", cache_dir=tmp_path) == "cached"
+        assert fetch_url("https://example.com/c", cache_dir=tmp_path) == "cached"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_not_found_cached_briefly(self, tmp_path):
+        responses.add(responses.GET, "https://example.com/nf", status=404)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError) as exc:
+                fetch_url("https://example.com/nf", cache_dir=tmp_path)
+            assert exc.value.response.status_code == 404
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_cached_miss_expires(self, tmp_path, monkeypatch):
+        responses.add(responses.GET, "https://example.com/nf", status=404)
+        with pytest.raises(requests.HTTPError):
+            fetch_url("https://example.com/nf", cache_dir=tmp_path, miss_ttl=60)
+        now = http.time.time()
+        monkeypatch.setattr(http.time, "time", lambda: now + 61)
+        with pytest.raises(requests.HTTPError):
+            fetch_url("https://example.com/nf", cache_dir=tmp_path, miss_ttl=60)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_rate_limited_honours_retry_after(self, tmp_path, monkeypatch):
+        responses.add(
+            responses.GET,
+            "https://example.com/busy",
+            status=429,
+            headers={"Retry-After": "120"},
+        )
+        with pytest.raises(requests.HTTPError):
+            fetch_url("https://example.com/busy", cache_dir=tmp_path)
+        assert http._get_cached_miss(tmp_path, "https://example.com/busy") == 429
+        now = http.time.time()
+        monkeypatch.setattr(http.time, "time", lambda: now + 121)
+        assert http._get_cached_miss(tmp_path, "https://example.com/busy") is None
+
+    @responses.activate
+    def test_miss_not_cached_without_cache_dir(self):
+        responses.add(responses.GET, "https://example.com/nf", status=404)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                fetch_url("https://example.com/nf")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_sec_retries_go_through_rate_limiter(self, monkeypatch):
+        limited, sleeps = [], []
+        monkeypatch.setattr(http, "_rate_limit", lambda: limited.append(1))
+        monkeypatch.setattr(http.time, "sleep", sleeps.append)
+        responses.add(responses.GET, "https://www.sec.gov/x", status=503)
+        responses.add(responses.GET, "https://www.sec.gov/x", body="ok")
+        assert fetch_url("https://www.sec.gov/x", use_sec_agent=True) == "ok"
+        assert len(responses.calls) == 2
+        assert len(limited) == 2
+        assert sleeps == [http._BACKOFF]
+
+    @responses.activate
+    def test_sec_gives_up_after_retries(self, monkeypatch):
+        monkeypatch.setattr(http, "_rate_limit", lambda: None)
+        monkeypatch.setattr(http.time, "sleep", lambda s: None)
+        responses.add(responses.GET, "https://www.sec.gov/x", status=503)
+        with pytest.raises(requests.HTTPError):
+            fetch_url("https://www.sec.gov/x", use_sec_agent=True)
+        assert len(responses.calls) == 1 + http._STATUS_RETRIES
+
+    def test_retry_policy_is_bounded(self):
+        for adapter in (http._adapter, http._sec_adapter):
+            retry = adapter.max_retries
+            assert retry.respect_retry_after_header is False
+            assert retry.read == 0
+            assert retry.connect <= 1
+            assert 429 not in retry.status_forcelist
+        assert http._sec_adapter.max_retries.status == 0
+
+    def test_shared_session_pools_connections(self):
+        adapter = http._session.get_adapter("https://www.sec.gov/")
+        assert adapter._pool_maxsize >= 4
+
+    @responses.activate
+    def test_transient_error_retried(self):
+        responses.add(responses.GET, "https://example.com/r", status=503)
+        responses.add(responses.GET, "https://example.com/r", body="ok")
+        assert fetch_url("https://example.com/r") == "ok"
+        assert len(responses.calls) == 2
+
+
+class TestRateLimit:
+    @staticmethod
+    def _bucket(monkeypatch, clock):
+        sleeps = []
+        monkeypatch.setattr(http.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(http.time, "sleep", sleeps.append)
+        return http._TokenBucket(rate=10, capacity=2), sleeps
+
+    def test_burst_within_capacity_does_not_sleep(self, monkeypatch):
+        bucket, sleeps = self._bucket(monkeypatch, [100.0])
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == []
+
+    def test_sleeps_when_budget_exhausted(self, monkeypatch):
+        bucket, sleeps = self._bucket(monkeypatch, [100.0])
+        for _ in range(4):
+            bucket.acquire()
+        # Each waiter reserves the next slot, so they queue at 1/rate
+        assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    def test_refills_over_time(self, monkeypatch):
+        clock = [100.0]
+        bucket, sleeps = self._bucket(monkeypatch, clock)
+        bucket.acquire()
+        bucket.acquire()
+        clock[0] += 0.15
+        bucket.acquire()
+        assert sleeps == []
+        assert bucket.tokens == pytest.approx(0.5)
+
+    def test_sec_bucket_allows_no_burst(self):
+        assert http._bucket.capacity == 1
+        assert http._bucket.rate == http.SEC_MAX_REQUESTS_PER_SECOND
+
+    def test_refill_capped_at_capacity(self, monkeypatch):
+        clock = [100.0]
+        bucket, _ = self._bucket(monkeypatch, clock)
+        clock[0] += 60
+        bucket.acquire()
+        assert bucket.tokens == pytest.approx(1)
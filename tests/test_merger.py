@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import date
 
+import pandas as pd
+
 from insider_scanner.core.models import InsiderTrade
 from insider_scanner.core.merger import (
     merge_trades,
@@ -173,6 +175,15 @@ class TestTradesToDataframe:
         df = trades_to_dataframe([])
         assert len(df) == 0
 
+    def test_matches_to_dict_records(self):
+        trades = [
+            _trade(trade_date=date(2025, 1, 2), filing_date=date(2025, 1, 4)),
+            _trade(ticker="MSFT", name="Nadella", trade_type="Buy"),
+        ]
+        trades[1].is_congress = True
+        expected = pd.DataFrame([t.to_dict() for t in trades])
+        pd.testing.assert_frame_equal(trades_to_dataframe(trades), expected)
+
 
 class TestSaveScanResults:
     def test_save_creates_files(self, tmp_path):
@@ -180,3 +191,11 @@ class TestSaveScanResults:
         save_scan_results(trades, label="test_scan", output_dir=tmp_path)
         assert (tmp_path / "test_scan.csv").exists()
         assert (tmp_path / "test_scan.json").exists()
+
+    def test_save_reuses_given_frame(self, tmp_path):
+        trades = [_trade(), _trade(ticker="MSFT", name="Nadella")]
+        save_scan_results(trades, label="built", output_dir=tmp_path)
+        df = trades_to_dataframe(trades)
+        save_scan_results(trades, label="given", output_dir=tmp_path, df=df)
+        built = (tmp_path / "built.csv").read_text()
+        assert (tmp_path / "given.csv").read_text() == built
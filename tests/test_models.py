@@ -102,6 +102,15 @@ class TestCongressTradeSerialisation:
         assert t.filing_date is None
         assert t.amount_low == 0.0
 
+    def test_from_dict_invalid_dates(self):
+        t = CongressTrade.from_dict({"filing_date": "n/a", "trade_date": None})
+        assert t.filing_date is None
+        assert t.trade_date is None
+
+    def test_from_dict_date_objects(self):
+        t = CongressTrade.from_dict({"filing_date": date(2026, 2, 1)})
+        assert t.filing_date == date(2026, 2, 1)
+
     def test_roundtrip(self):
         original = CongressTrade(
             official_name="Roundtrip Test",
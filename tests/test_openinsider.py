@@ -7,6 +7,9 @@ from datetime import date
 import responses
 
 from insider_scanner.core.openinsider import (
+    _column_indices,
+    _parse_number,
+    _parse_numbers,
     parse_openinsider_html,
     scrape_ticker,
     scrape_latest,
@@ -58,6 +61,27 @@ class TestParseOpeninsider:
         trades = parse_openinsider_html("<html><body></body></html>")
         assert trades == []
 
+    def test_reparse_returns_independent_trades(self):
+        first = parse_openinsider_html(OPENINSIDER_HTML)
+        first[0].is_congress = True
+        second = parse_openinsider_html(OPENINSIDER_HTML)
+        assert second[0] is not first[0]
+        assert not second[0].is_congress
+
+    def test_known_header_row_skips_classification(self):
+        parse_openinsider_html(OPENINSIDER_HTML)
+        misses = _column_indices.cache_info().misses
+        # A different page with the same header row reuses the column layout
+        other_page = OPENINSIDER_HTML.replace("AAPL", "MSFT")
+        trades = parse_openinsider_html(other_page)
+        assert _column_indices.cache_info().misses == misses
+        assert {t.ticker for t in trades} >= {"MSFT"}
+
+    def test_batch_number_parse_matches_single(self):
+        raw = ["$1,234.50", "+5,000", "(2,000)", "-", "", " 42 ", "n/a"]
+        assert _parse_numbers(raw) == [_parse_number(t) for t in raw]
+        assert _parse_numbers([]) == []
+
 
 class TestScrapeOpeninsider:
     @responses.activate
@@ -7,7 +7,11 @@ from unittest.mock import patch
 
 import responses
 
-from insider_scanner.core.secform4 import parse_secform4_html, scrape_ticker
+from insider_scanner.core.secform4 import (
+    _parse_date,
+    parse_secform4_html,
+    scrape_ticker,
+)
 from tests.fixtures import SECFORM4_HTML
 
 # AAPL CIK (raw, not zero-padded)
@@ -83,6 +87,30 @@ class TestParseSecform4:
         trades = parse_secform4_html("<html><body></body></html>", "TEST")
         assert trades == []
 
+    def test_reparse_returns_independent_trades(self):
+        first = parse_secform4_html(SECFORM4_HTML, "AAPL")
+        first[0].edgar_url = ""
+        second = parse_secform4_html(SECFORM4_HTML, "AAPL")
+        assert second[0] is not first[0]
+        assert second[0].edgar_url.startswith("https://www.secform4.com/filings/")
+
+
+class TestParseDate:
+    def test_iso(self):
+        assert _parse_date("2025-11-07") == date(2025, 11, 7)
+
+    def test_iso_with_time(self):
+        assert _parse_date("2025-11-07 18:30:00") == date(2025, 11, 7)
+
+    def test_month_first(self):
+        assert _parse_date("11/07/2025") == date(2025, 11, 7)
+        assert _parse_date("11-07-2025") == date(2025, 11, 7)
+
+    def test_invalid(self):
+        assert _parse_date("") is None
+        assert _parse_date("-") is None
+        assert _parse_date("n/a") is None
+
 
 class TestScrapeSecform4:
     """Tests for scrape_ticker with CIK resolution mocked."""
@@ -27,6 +27,10 @@ class TestNormalizeName:
     def test_comma_removal(self):
         assert _normalize_name("Smith, John") == "smith john"
 
+    def test_suffix_only_as_whole_word(self):
+        assert _normalize_name("Ivan Srinivasan") == "ivan srinivasan"
+        assert _normalize_name("Smith Ivan Jr") == "smith ivan"
+
 
 class TestLoadSave:
     def test_save_and_load(self, tmp_path):
@@ -48,6 +52,15 @@ class TestLoadSave:
         result = load_congress_members(path)
         assert result == []
 
+    def test_reload_after_file_changes(self, tmp_path):
+        path = tmp_path / "members.json"
+        save_congress_members([{"name": "A"}], path)
+        first = load_congress_members(path)
+        first.append({"name": "Z"})  # caller's list is a copy
+        assert load_congress_members(path) == [{"name": "A"}]
+        save_congress_members([{"name": "A"}, {"name": "Bb"}], path)
+        assert len(load_congress_members(path)) == 2
+
     def test_init_default(self, tmp_path):
         path = tmp_path / "congress.json"
         init_default_congress_file(path)
@@ -115,3 +128,24 @@ class TestFlagCongressTrades:
         assert trades[0].is_congress
         assert not trades[1].is_congress
         assert trades[2].is_congress
+
+    def test_repeated_insider_names(self):
+        members = [{"name": "Pelosi Nancy"}]
+        trades = [self._make_trade(n) for n in ("Pelosi Nancy", "Cook Timothy") * 3]
+        flag_congress_trades(trades, members)
+        assert [t.is_congress for t in trades] == [True, False] * 3
+        assert trades[4].congress_member == "Pelosi Nancy"
+
+    def test_partial_match_first_member_wins(self):
+        members = [{"name": "Smith Jo"}, {"name": "Smith John"}, {"name": "Lee Al"}]
+        trades = [
+            self._make_trade("Smith John"),
+            self._make_trade("Smith"),
+            self._make_trade("Lee Alan"),
+            self._make_trade("Mr Lee Al"),
+        ]
+        flag_congress_trades(trades, members)
+        assert trades[0].congress_member == "Smith John"  # exact match first
+        assert trades[1].congress_member == "Smith Jo"
+        assert trades[2].congress_member == "Lee Al"
+        assert trades[3].congress_member == "Lee Al"